@@ -0,0 +1,135 @@
+from functools import partial
+from typing import (
+    Dict,
+    List,
+)
+from utils.python.combine_list_of_dicts import combine_list_of_dicts
+from utils.python.serialize_json import serialize_json
+import argparse
+import logging
+import timeit
+import tracemalloc
+
+def combine_list_of_dicts_serialized(
+    *lists
+) -> List[Dict]:
+    """
+    Arguments:
+    - *lists: any number of lists of objects
+
+    Previous (set of serialized objects) implementation of combine_list_of_dicts, kept as the benchmark baseline.
+    """
+
+    combined = []
+    for lst in lists:
+        combined.extend(lst)
+
+    seen = set()
+    unique_dicts = []
+    for d in combined:
+        serialized = serialize_json(data=d, sort_keys=True)
+        if serialized not in seen:
+            seen.add(serialized)
+            unique_dicts.append(d)
+
+    return unique_dicts
+
+def create_synthetic_matchmx_list(
+    record_count: int,
+    start_index: int = 0
+) -> List[Dict]:
+    """
+    Arguments:
+    - record_count: Number of records
+    - start_index: Index of the first record (records with the same index are equal)
+
+    Returns records shaped like matchmx rows (47 keys, string/int/float values).
+    """
+
+    return [
+        {
+            'date': f"2024{index % 12 + 1:02d}{index % 28 + 1:02d}",
+            'tourn': f"Tournament {index % 60}",
+            'surf': ['Hard', 'Clay', 'Grass'][index % 3],
+            'level': 'A',
+            'wl': 'W' if index % 2 else 'L',
+            'rank': index % 200 + 1,
+            'seed': '',
+            'entry': '',
+            'round': ['R32', 'R16', 'QF', 'SF', 'F'][index % 5],
+            'score': '6-4 3-6 7-6(5)',
+            'max': 3,
+            'opp': f"Opponent {index}",
+            **{f"stat_{stat_index}": index * 0.5 + stat_index for stat_index in range(35)},
+        }
+        for index in range(start_index, start_index + record_count)
+    ]
+
+def main(
+    record_count: int = 2000,
+    overlap_ratio: float = 0.5,
+    repeat_count: int = 10,
+    key_list: List[str] = ['date', 'tourn', 'round', 'opp']
+):
+    """
+    Arguments:
+    - record_count: Number of records in each of the two lists
+    - overlap_ratio: Share of the second list that duplicates the first (ex. matchmx/morematchmx overlap)
+    - repeat_count: Number of times the lists are combined per implementation
+    - key_list: Keys fingerprinted by the key_list run of combine_list_of_dicts
+
+    Times (and measures peak memory of) combine_list_of_dicts, fingerprinting the whole object and only key_list,
+    against the previous implementation (set of serialized objects) and checks that all return the same objects.
+    """
+
+    # set logging config
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+
+    first_list = create_synthetic_matchmx_list(record_count=record_count)
+    second_list = create_synthetic_matchmx_list(record_count=record_count, start_index=int(record_count * (1 - overlap_ratio)))
+
+    implementation_dict = {
+        'serialized set': combine_list_of_dicts_serialized,
+        'fingerprint (all keys)': combine_list_of_dicts,
+        f"fingerprint (key_list: {key_list})": partial(combine_list_of_dicts, key_list=key_list),
+    }
+
+    # all implementations must return the same objects
+    unique_dicts = combine_list_of_dicts_serialized(first_list, second_list)
+    for implementation_name, implementation in implementation_dict.items():
+        if implementation(first_list, second_list) != unique_dicts:
+            logging.error(f"{implementation_name} differs from the serialized set implementation.")
+
+    logging.info(f"{2 * record_count} records ({len(unique_dicts)} unique):")
+    baseline_seconds = None
+    for implementation_name, implementation in implementation_dict.items():
+
+        # peak memory allocated while combining
+        tracemalloc.start()
+        implementation(first_list, second_list)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        seconds = timeit.timeit(lambda: implementation(first_list, second_list), number=repeat_count) / repeat_count
+        baseline_seconds = baseline_seconds or seconds
+        logging.info(
+            f"- {implementation_name}: {seconds * 1000:.2f} ms ({baseline_seconds / seconds:.1f}x), "
+            f"peak memory {peak_bytes / 1024:.0f} KiB."
+        )
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--record_count', type=int, default=2000, help='Number of records in each of the two lists')
+    parser.add_argument('--overlap_ratio', type=float, default=0.5, help='Share of the second list that duplicates the first')
+    parser.add_argument('--repeat_count', type=int, default=10, help='Number of times the lists are combined per implementation')
+    parser.add_argument('--key_list', nargs='+', default=['date', 'tourn', 'round', 'opp'], help='Keys fingerprinted by the key_list run')
+    args = parser.parse_args()
+    main(
+        record_count=args.record_count,
+        overlap_ratio=args.overlap_ratio,
+        repeat_count=args.repeat_count,
+        key_list=args.key_list
+    )
@@ -0,0 +1,127 @@
+from bs4 import BeautifulSoup
+from scripts.web.tennisabstract.matches.parse_match_pointlog import parse_match_pointlog
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+from utils.web.scrape_javascript_var import scrape_javascript_var
+import argparse
+import logging
+import os
+import timeit
+
+def parse_match_pointlog_soup(
+        pointlog_html: str
+) -> List[Dict]:
+    """
+    Arguments:
+    - pointlog_html: HTML string containing pointlog data
+
+    Previous (BeautifulSoup tree) implementation of parse_match_pointlog, kept as the benchmark baseline.
+    """
+
+    point_data_list = []
+
+    # extract the data (after 1st tr - headers)
+    pointlog_soup = BeautifulSoup(pointlog_html, 'html.parser')
+    pointlog_tr_list = pointlog_soup.find_all('tr')[1:]
+
+    # filter out empty rows
+    pointlog_tr_list = [
+        tr for tr in pointlog_tr_list
+        if all(td.get_text(strip=True) for td in tr.find_all('td'))
+    ]
+
+    # loop through tr list
+    for index, tr in enumerate(pointlog_tr_list):
+        tr_td_list = tr.find_all('td')
+        point_data = {
+            'point_number': index + 1,
+            'server': tr_td_list[0].get_text(strip=True),
+            'sets': tr_td_list[1].get_text(strip=True),
+            'games': tr_td_list[2].get_text(strip=True),
+            'points': tr_td_list[3].get_text(strip=True),
+            'point_description': tr_td_list[4].get_text(strip=True),
+        }
+        point_data_list.append(point_data)
+    return point_data_list
+
+def create_synthetic_pointlog_html(
+    point_count: int
+) -> str:
+    """
+    Arguments:
+    - point_count: Number of point rows
+
+    Returns pointlog HTML shaped like a match page pointlog (header row, point rows, an empty spacer row after every game).
+    """
+
+    tr_list = ['<tr><th>Server</th><th>Sets</th><th>Games</th><th>Pts</th><th>Point description</th></tr>']
+    for point_index in range(point_count):
+        tr_list.append(
+            f'<tr><td>Player {point_index % 2 + 1}</td><td>0-0</td><td>{point_index // 6}-{point_index // 7}</td>'
+            f'<td>{point_index % 4 * 15}-0</td><td>1st serve wide; <b>ace</b> &amp; forehand {point_index}.</td></tr>'
+        )
+        if point_index % 6 == 5:
+            tr_list.append('<tr><td>&nbsp;</td><td></td><td></td><td></td><td></td></tr>')
+
+    return f"<table>{''.join(tr_list)}</table>"
+
+def main(
+    page_folder_name: Optional[str] = None,
+    synthetic_point_count: int = 300,
+    repeat_count: int = 20
+):
+    """
+    Arguments:
+    - page_folder_name: (optional) Local folder of saved match pages (ex. the matches folder of check_html_parser_parity)
+    - synthetic_point_count: Number of point rows of the synthetic pointlog (0 to skip)
+    - repeat_count: Number of times each pointlog is parsed per implementation
+
+    Times parse_match_pointlog (single pass html.parser events) against the previous BeautifulSoup implementation
+    and checks that both return the same points.
+    """
+
+    # set logging config
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+
+    # pointlogs: name -> html
+    pointlog_html_dict = {}
+    if synthetic_point_count > 0:
+        pointlog_html_dict[f"synthetic ({synthetic_point_count} points)"] = create_synthetic_pointlog_html(point_count=synthetic_point_count)
+    if page_folder_name:
+        for page_file_name in sorted(os.listdir(page_folder_name)):
+            with open(os.path.join(page_folder_name, page_file_name), encoding='utf-8') as f:
+                pointlog_html = scrape_javascript_var(content=f.read(), var='pointlog')
+            if pointlog_html:
+                pointlog_html_dict[page_file_name] = pointlog_html
+
+    for pointlog_name, pointlog_html in pointlog_html_dict.items():
+
+        # both implementations must return the same points
+        point_data_list = parse_match_pointlog(pointlog_html=pointlog_html)
+        if point_data_list != parse_match_pointlog_soup(pointlog_html=pointlog_html):
+            logging.error(f"{pointlog_name}: parse_match_pointlog differs from the BeautifulSoup implementation.")
+
+        soup_seconds = timeit.timeit(lambda: parse_match_pointlog_soup(pointlog_html=pointlog_html), number=repeat_count) / repeat_count
+        single_pass_seconds = timeit.timeit(lambda: parse_match_pointlog(pointlog_html=pointlog_html), number=repeat_count) / repeat_count
+        logging.info(
+            f"{pointlog_name}: {len(point_data_list)} points - BeautifulSoup {soup_seconds * 1000:.2f} ms, "
+            f"single pass {single_pass_seconds * 1000:.2f} ms ({soup_seconds / single_pass_seconds:.1f}x)."
+        )
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--page_folder_name', help='Local folder of saved match pages')
+    parser.add_argument('--synthetic_point_count', type=int, default=300, help='Number of point rows of the synthetic pointlog (0 to skip)')
+    parser.add_argument('--repeat_count', type=int, default=20, help='Number of times each pointlog is parsed per implementation')
+    args = parser.parse_args()
+    main(
+        page_folder_name=args.page_folder_name,
+        synthetic_point_count=args.synthetic_point_count,
+        repeat_count=args.repeat_count
+    )
@@ -1,20 +1,75 @@
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from datetime import datetime
-from utils.bigquery.add_audit_columns import add_audit_columns
-from utils.bigquery.alter_target_table import alter_target_table
-from utils.bigquery.create_schema_field import create_schema_field
+from scripts.web.tennisabstract.get_url_manifest import get_url_manifest
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
 from utils.bigquery.check_table_existence import check_table_existence
-from utils.bigquery.create_table_with_cloud_storage import create_table_with_cloud_storage
-from utils.bigquery.drop_table import drop_table
-from utils.bigquery.insert_target_table import insert_target_table
 from utils.bigquery.get_control_object_record_full import get_control_object_record_full
-from utils.bigquery.update_target_table import update_target_table
+from utils.bigquery.get_target_table_record_hashes import get_target_table_record_hashes
+from utils.bigquery.get_target_table_column_values import get_target_table_column_values
+from utils.bigquery.load_target_table_with_cloud_storage import load_target_table_with_cloud_storage
+from utils.bigquery.load_target_table_with_storage_write_api import load_target_table_with_storage_write_api
+from utils.cloud_run.get_cloud_run_task_properties import get_cloud_run_task_properties
+from utils.cloud_storage.delete_cloud_storage_object import delete_cloud_storage_object
 from utils.cloud_storage.delete_cloud_storage_objects import delete_cloud_storage_objects
+from utils.cloud_storage.get_cloud_storage_object_extension import get_cloud_storage_object_extension
 from utils.cloud_storage.get_cloud_storage_objects import get_cloud_storage_objects
+from utils.cloud_storage.read_json_from_cloud_storage import read_json_from_cloud_storage
 from utils.cloud_storage.upload_df_to_cloud_storage import upload_df_to_cloud_storage
+from utils.cloud_storage.write_json_to_cloud_storage import write_json_to_cloud_storage
+from utils.cloud_storage.write_parquet_to_cloud_storage import write_parquet_to_cloud_storage
 from utils.python.map_python_type_to_bq import map_python_type_to_bq
+from utils.python.get_record_hash import (
+    get_record_hash,
+    record_hash_column_name,
+)
+from utils.python.merge_column_metadata import merge_column_metadata
+from utils.python.serialize_json import serialize_json
+from utils.web.response_cache_config import response_cache_config
+from utils.web.scrape_url_list_default_config import scrape_url_list_default_config
 import argparse
+import hashlib
 import importlib
 import logging
+import pyarrow as pa
+
+def checkpoint_uploaded_batches(
+    pending_upload_list: List[Tuple[Future, str, Dict]],
+    max_pending_count: int,
+    checkpoint_dict: Dict,
+    bucket_name: str,
+    checkpoint_object_path: str
+):
+    """
+    Arguments:
+    - pending_upload_list: List of (upload future, batch number, batch checkpoint) in batch order (updated in place)
+    - max_pending_count: Number of uploads allowed to remain pending
+    - checkpoint_dict: Task checkpoint (updated in place)
+    - bucket_name: Cloud Storage bucket name
+    - checkpoint_object_path: Full object path of the task checkpoint
+
+    Checkpoints finished uploads in batch order, waiting on the oldest upload while more than max_pending_count are pending.
+    Upload errors are raised.
+    """
+
+    while pending_upload_list and (pending_upload_list[0][0].done() or len(pending_upload_list) > max_pending_count):
+
+        upload_future, batch_number_fmt, batch_checkpoint_dict = pending_upload_list.pop(0)
+        upload_future.result()
+
+        # checkpoint batch (after its object is uploaded)
+        checkpoint_dict['batch_dict'][batch_number_fmt] = batch_checkpoint_dict
+        write_json_to_cloud_storage(
+            data=checkpoint_dict,
+            bucket_name=bucket_name,
+            object_path=checkpoint_object_path
+        )
 
 def main(
     bigquery_target_table_id: str
@@ -31,11 +86,20 @@ def main(
         format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
     )
 
+    # set once this task claims the bigquery load (released if the load fails, so a retry can claim it again)
+    coordinator_claimed_flag = False
+
     try:
 
         # get current date/timestamp (for use in GCS naming)
         today_str = datetime.now().strftime("%Y%m%d")
 
+        # get cloud run task properties (each task processes its own shard of the url list)
+        cloud_run_task_properties_dict = get_cloud_run_task_properties()
+        task_index = cloud_run_task_properties_dict['task_index']
+        task_count = cloud_run_task_properties_dict['task_count']
+        execution_name = cloud_run_task_properties_dict['execution_name']
+
         # query for control table record
         table_record_dict = get_control_object_record_full(
             target_table_id=bigquery_target_table_id
@@ -57,104 +121,446 @@ def main(
         source_load_record_batch_count = table_record_dict['source_load_record_batch_count'] or 100
         unique_column_name_list = table_record_dict['unique_column_name_list']
 
+        # parse optional scraping properties (fall back to defaults if not set in control table)
+        source_load_concurrency_per_host = table_record_dict.get('source_load_concurrency_per_host') or scrape_url_list_default_config['concurrency_per_host']
+        source_load_request_delay_seconds = table_record_dict.get('source_load_request_delay_seconds')
+        source_load_upload_queue_size = table_record_dict.get('source_load_upload_queue_size') or 2
+        cloudstorage_gzip_flag = table_record_dict.get('cloudstorage_gzip_flag') or False
+        cloudstorage_file_format = table_record_dict.get('cloudstorage_file_format') or 'json'
+        bigquery_scd2_apply_mode = table_record_dict.get('bigquery_scd2_apply_mode') or 'update_insert'
+        bigquery_temp_table_type = table_record_dict.get('bigquery_temp_table_type') or 'load'
+        bigquery_sink_type = table_record_dict.get('bigquery_sink_type') or 'cloud_storage'
+        bigquery_target_partition_column_name = table_record_dict.get('bigquery_target_partition_column_name')
+        bigquery_target_partition_type = table_record_dict.get('bigquery_target_partition_type') or 'DAY'
+        bigquery_target_cluster_column_name_list = table_record_dict.get('bigquery_target_cluster_column_name_list') or None
+        if source_load_request_delay_seconds is None:
+            source_load_request_delay_seconds = scrape_url_list_default_config['politeness_delay_seconds']
+
+        # parse optional incremental load properties
+        source_load_incremental_flag = table_record_dict.get('source_load_incremental_flag') or False
+        source_load_incremental_window_days = table_record_dict.get('source_load_incremental_window_days') or 0
+        cloudstorage_url_manifest_folder_name = table_record_dict.get('cloudstorage_url_manifest_folder_name')
+
+        # parse optional unchanged record properties
+        source_load_skip_unchanged_flag = table_record_dict.get('source_load_skip_unchanged_flag') or False
+        source_load_record_hash_exclude_column_name_list = table_record_dict.get('source_load_record_hash_exclude_column_name_list') or []
+
+        # parse optional entity specific scraping properties (only passed through when set)
+        data_df_kwarg_dict = {}
+        if table_record_dict.get('source_load_matchmx_columnar_flag'):
+            if entity_name == 'players_classic':
+                data_df_kwarg_dict['matchmx_columnar'] = True
+            else:
+                logging.warning(f"source_load_matchmx_columnar_flag only applies to players_classic - ignored for {entity_name}.")
+
+        # point the web response cache at cloud storage (if configured in control table)
+        cloudstorage_response_cache_folder_name = table_record_dict.get('cloudstorage_response_cache_folder_name')
+        if cloudstorage_response_cache_folder_name:
+            response_cache_config['cache_uri'] = f"gs://{cloudstorage_bucket_name}/{cloudstorage_response_cache_folder_name}"
+            logging.info(f"Using web response cache: {response_cache_config['cache_uri']}.")
+
         # construct import path
         import_path = f"scripts.web.tennisabstract.{entity_name}"
         
         # get url list
         url_list_module_path = f"{import_path}.get_url_list"
         url_list_module = importlib.import_module(f"{url_list_module_path}")
-        url_list = url_list_module.main()
-        url_list_len = len(url_list)
 
-        # create cloud storage properties
-        cloudstorage_folder_name = f"{cloudstorage_folder_name_prefix}/{today_str}"
-        cloudstorage_to_bigquery_object_pattern = f"{cloudstorage_folder_name}/*.json"
+        # read url list from the shared daily manifest (if configured and entity is in it)
+        url_list = None
+        if cloudstorage_url_manifest_folder_name:
+            url_manifest = get_url_manifest(
+                bucket_name=cloudstorage_bucket_name,
+                folder_name=cloudstorage_url_manifest_folder_name,
+                run_date_str=today_str
+            )
+            url_list = url_manifest.get(entity_name)
 
-        # delete cloud storage objects (if exist from previous run)
-        delete_cloud_storage_objects(
-            bucket_name=cloudstorage_bucket_name,
-            prefix=f"{cloudstorage_folder_name}/"
-        )
+        # otherwise fetch url list from source
+        if url_list is None:
+            url_list = url_list_module.main()
 
-        # initialize a dict to track column metadata
-        column_metadata_dict = {}
+        # only keep new urls (plus a rolling window of recent ones) if entity supports incremental loads
+        if source_load_incremental_flag and hasattr(url_list_module, 'get_incremental_url_list'):
 
-        # loop through records
-        for i in range(0, url_list_len, source_load_record_batch_count):
+            # seed index of already ingested urls from target table (if it exists)
+            ingested_url_set = set()
+            if check_table_existence(
+                project_id=bigquery_target_project_id,
+                dataset_id=bigquery_target_dataset_id,
+                table_id=bigquery_target_table_id
+            ):
+                ingested_url_set = get_target_table_column_values(
+                    project_id=bigquery_target_project_id,
+                    dataset_id=bigquery_target_dataset_id,
+                    table_id=bigquery_target_table_id,
+                    column_name=url_list_module.incremental_column_name
+                )
+
+            url_list = url_list_module.get_incremental_url_list(
+                url_list=url_list,
+                ingested_url_set=ingested_url_set,
+                window_days=source_load_incremental_window_days
+            )
 
-            # process the current batch
-            batch_number = i // source_load_record_batch_count + 1
-            batch_number_fmt = f"{batch_number:06d}"
-            start_idx = i
-            end_idx = min(i + source_load_record_batch_count, url_list_len)
-            url_list_batch = url_list[start_idx:end_idx]
+        # keep this task's shard of the url list (every task_count-th url starting at the task index)
+        url_list = url_list[task_index::task_count]
+        url_list_len = len(url_list)
+        logging.info(f"Task {task_index} of {task_count} (execution: {execution_name}): {url_list_len} urls.")
 
-            logging.info(f"Processing records {start_idx} to {end_idx - 1} (batch size: {len(url_list_batch)}).")
+        # stream records to bigquery instead of staging them in cloud storage (single task json loads only)
+        storage_write_flag = bigquery_sink_type == 'storage_write_api'
+        if storage_write_flag and (task_count > 1 or cloudstorage_file_format != 'json'):
+            logging.warning(f"Storage Write API sink requires a single task and json format - staging in Cloud Storage instead.")
+            storage_write_flag = False
+        storage_write_record_list = []
 
-            # get data
-            data_df_module_path = f"{import_path}.get_data_df"
-            data_df_module = importlib.import_module(f"{data_df_module_path}")
-            data_df = data_df_module.main(
-                url_list=url_list_batch
-            )
+        # create cloud storage properties
+        cloudstorage_folder_name = f"{cloudstorage_folder_name_prefix}/{today_str}"
+        cloudstorage_object_extension = get_cloud_storage_object_extension(
+            file_format=cloudstorage_file_format,
+            gzip_flag=cloudstorage_gzip_flag
+        )
+        cloudstorage_to_bigquery_object_pattern = f"{cloudstorage_folder_name}/*{cloudstorage_object_extension}"
+        cloudstorage_task_folder_name = f"{cloudstorage_folder_name_prefix}/_tasks/{today_str}/{execution_name}"
+        cloudstorage_checkpoint_folder_name = f"{cloudstorage_folder_name_prefix}/_checkpoints/{today_str}"
+        task_index_fmt = f"{task_index:04d}"
+
+        # read this task's checkpoint (batches finished by an earlier run of today's ingest)
+        # only reused if the url list, batch size and object extension are unchanged, otherwise start over
+        cloudstorage_checkpoint_object_path = f"{cloudstorage_checkpoint_folder_name}/checkpoint__{task_index_fmt}.json"
+        url_list_hash = hashlib.sha256(serialize_json(data=url_list, sort_keys=True, default=str)).hexdigest()
+        checkpoint_dict = read_json_from_cloud_storage(
+            bucket_name=cloudstorage_bucket_name,
+            object_path=cloudstorage_checkpoint_object_path
+        )
+        if (
+            storage_write_flag
+            or checkpoint_dict is None
+            or checkpoint_dict['url_list_hash'] != url_list_hash
+            or checkpoint_dict['record_batch_count'] != source_load_record_batch_count
+            or checkpoint_dict.get('object_extension', '.json') != cloudstorage_object_extension
+        ):
+            checkpoint_dict = {
+                'url_list_hash': url_list_hash,
+                'record_batch_count': source_load_record_batch_count,
+                'object_extension': cloudstorage_object_extension,
+                'batch_dict': {},
+            }
+        else:
+            logging.info(f"Resuming from checkpoint: {len(checkpoint_dict['batch_dict'])} batches already done.")
+
+        # objects of checkpointed batches are kept (batches without data have no object)
+        checkpoint_object_path_set = {
+            batch_checkpoint_dict['object_path']
+            for batch_checkpoint_dict in checkpoint_dict['batch_dict'].values()
+            if batch_checkpoint_dict['object_path'] is not None
+        }
+
+        # delete cloud storage objects written by this task (if exist from previous run and not checkpointed)
+        # the first task also deletes objects of task indexes outside of this run (ex. a previous run with more tasks)
+        for object_dict in get_cloud_storage_objects(
+            bucket_name=cloudstorage_bucket_name,
+            prefix=f"{cloudstorage_folder_name}/"
+        ):
+            object_name = object_dict['name']
+            if object_name in checkpoint_object_path_set:
+                continue
 
-            # check if dataframe is not empty
-            if not data_df.empty:
+            # object names end with __<task index>__<batch number><object extension>
+            object_task_index_str = object_name.rsplit('__', 2)[-2] if object_name.count('__') >= 2 else ''
+            object_task_index = int(object_task_index_str) if object_task_index_str.isdigit() else None
 
-                # upload to cloud storage
-                cloudstorage_object_name = f"{cloudstorage_object_name_prefix}__{today_str}__{batch_number_fmt}.json"
-                cloudstorage_object_path = f"{cloudstorage_folder_name}/{cloudstorage_object_name}"
-                upload_df_to_cloud_storage(
-                    df=data_df,
+            if object_task_index == task_index or (task_index == 0 and (object_task_index is None or object_task_index >= task_count)):
+                delete_cloud_storage_object(
                     bucket_name=cloudstorage_bucket_name,
-                    object_path=cloudstorage_object_path
+                    object_name=object_name
                 )
 
-                # capture column data types
-                for col in data_df.columns:
+        # get data module (and typed schema if staging parquet)
+        data_df_module_path = f"{import_path}.get_data_df"
+        data_df_module = importlib.import_module(f"{data_df_module_path}")
+        if cloudstorage_file_format == 'parquet':
+            data_schema_module_path = f"{import_path}.get_data_schema"
+            data_schema_module = importlib.import_module(f"{data_schema_module_path}")
+            data_schema = data_schema_module.main(**data_df_kwarg_dict)
+            if source_load_skip_unchanged_flag:
+                data_schema = data_schema.append(pa.field(record_hash_column_name, pa.string()))
+
+        # get record hashes of active target records (scraped records with the same hash are not staged)
+        target_record_hash_dict = {}
+        if source_load_skip_unchanged_flag and check_table_existence(
+            project_id=bigquery_target_project_id,
+            dataset_id=bigquery_target_dataset_id,
+            table_id=bigquery_target_table_id
+        ):
+            target_record_hash_dict = get_target_table_record_hashes(
+                project_id=bigquery_target_project_id,
+                dataset_id=bigquery_target_dataset_id,
+                table_id=bigquery_target_table_id,
+                unique_column_name_list=unique_column_name_list,
+                hash_column_name=record_hash_column_name
+            )
 
-                    # retrieve data types
-                    python_data_type = str(data_df[col].dtype).lower()
-                    bigquery_data_type = map_python_type_to_bq(data_type=python_data_type)
+        # initialize a dict to track column metadata
+        column_metadata_dict = {}
 
-                    # check if columns does not exist in metadata
-                    if col not in column_metadata_dict:
-                        column_metadata_dict[col] = {
-                            'column_name': col,
-                            'python_data_type': python_data_type,
-                            'bigquery_data_type': bigquery_data_type,
-                        }
+        # upload batches in background threads (at most source_load_upload_queue_size pending uploads)
+        with ThreadPoolExecutor(max_workers=source_load_upload_queue_size) as upload_executor:
+
+            pending_upload_list = []
+
+            # loop through records
+            for i in range(0, url_list_len, source_load_record_batch_count):
+
+                # process the current batch
+                batch_number = i // source_load_record_batch_count + 1
+                batch_number_fmt = f"{batch_number:06d}"
+                start_idx = i
+                end_idx = min(i + source_load_record_batch_count, url_list_len)
+                url_list_batch = url_list[start_idx:end_idx]
+
+                # skip batches uploaded by an earlier run (their objects are reused)
+                batch_checkpoint_dict = checkpoint_dict['batch_dict'].get(batch_number_fmt)
+                if batch_checkpoint_dict is not None:
+                    logging.info(f"Skipping records {start_idx} to {end_idx - 1} (batch {batch_number_fmt} done in earlier run).")
+                    merge_column_metadata(
+                        column_metadata_dict=column_metadata_dict,
+                        column_metadata_list=batch_checkpoint_dict['column_metadata_list']
+                    )
+                    continue
+
+                logging.info(f"Processing records {start_idx} to {end_idx - 1} (batch size: {len(url_list_batch)}).")
+
+                # get data (typed records for parquet, stringified dataframe for json)
+                if cloudstorage_file_format == 'parquet':
+                    data_list = data_df_module.get_data_list(
+                        url_list=url_list_batch,
+                        concurrency_per_host=source_load_concurrency_per_host,
+                        politeness_delay_seconds=source_load_request_delay_seconds,
+                        **data_df_kwarg_dict
+                    )
+                    data_count = len(data_list)
+                else:
+                    data_df = data_df_module.main(
+                        url_list=url_list_batch,
+                        concurrency_per_host=source_load_concurrency_per_host,
+                        politeness_delay_seconds=source_load_request_delay_seconds,
+                        **data_df_kwarg_dict
+                    )
+                    data_count = len(data_df)
+
+                # hash records and drop the ones unchanged since the last load (the hash is staged with the record)
+                if source_load_skip_unchanged_flag and data_count > 0:
+                    record_list = data_list if cloudstorage_file_format == 'parquet' else data_df.to_dict('records')
+                    record_hash_list = [
+                        get_record_hash(
+                            record=record,
+                            exclude_column_name_list=source_load_record_hash_exclude_column_name_list
+                        )
+                        for record in record_list
+                    ]
+                    changed_flag_list = [
+                        target_record_hash_dict.get(tuple(str(record.get(col)) for col in unique_column_name_list)) != record_hash
+                        for record, record_hash in zip(record_list, record_hash_list)
+                    ]
+                    changed_record_hash_list = [
+                        record_hash
+                        for record_hash, changed_flag in zip(record_hash_list, changed_flag_list)
+                        if changed_flag
+                    ]
+                    if cloudstorage_file_format == 'parquet':
+                        data_list = [
+                            {**record, record_hash_column_name: record_hash}
+                            for record, record_hash, changed_flag in zip(record_list, record_hash_list, changed_flag_list)
+                            if changed_flag
+                        ]
+                    else:
+                        data_df = data_df[changed_flag_list].assign(**{record_hash_column_name: changed_record_hash_list})
+                    logging.info(f"Skipping {data_count - len(changed_record_hash_list)} unchanged of {data_count} records.")
+                    data_count = len(changed_record_hash_list)
+
+                # keep records to stream to bigquery (once all batches are scraped)
+                if storage_write_flag:
+                    storage_write_record_list.extend(data_df.to_dict('records'))
+                    continue
+
+                # check if data is not empty
+                if data_count > 0:
+
+                    # upload to cloud storage (in background while the next batch is scraped)
+                    cloudstorage_object_name = f"{cloudstorage_object_name_prefix}__{today_str}__{task_index_fmt}__{batch_number_fmt}{cloudstorage_object_extension}"
+                    cloudstorage_object_path = f"{cloudstorage_folder_name}/{cloudstorage_object_name}"
+
+                    # column data types (left empty for parquet, BigQuery reads them from the parquet schema)
+                    batch_column_metadata_list = []
+
+                    if cloudstorage_file_format == 'parquet':
+                        upload_future = upload_executor.submit(
+                            write_parquet_to_cloud_storage,
+                            record_list=data_list,
+                            schema=data_schema,
+                            bucket_name=cloudstorage_bucket_name,
+                            object_path=cloudstorage_object_path
+                        )
 
-                    # otherwise, check the datatypes of columns already seen
                     else:
-                        python_data_type_existing = column_metadata_dict[col]['python_data_type']
-                        
-                        # if data type mismatch, cast to string
-                        if python_data_type_existing != python_data_type:
-                            logging.warning(f"Column {col} has inconsistent data type across batches: existing ({python_data_type_existing}) versus new ({python_data_type}) --> casting to string.")
-                            column_metadata_dict[col]['python_data_type'] = 'string'
-                            column_metadata_dict[col]['bigquery_data_type'] = 'STRING'
+                        upload_future = upload_executor.submit(
+                            upload_df_to_cloud_storage,
+                            df=data_df,
+                            bucket_name=cloudstorage_bucket_name,
+                            object_path=cloudstorage_object_path,
+                            gzip_flag=cloudstorage_gzip_flag
+                        )
+
+                        # capture column data types
+                        for col in data_df.columns:
+
+                            # retrieve data types
+                            python_data_type = str(data_df[col].dtype).lower()
+                            bigquery_data_type = map_python_type_to_bq(data_type=python_data_type)
+
+                            batch_column_metadata_list.append({
+                                'column_name': col,
+                                'python_data_type': python_data_type,
+                                'bigquery_data_type': bigquery_data_type,
+                            })
+
+                    # merge with columns of previous batches (cast to string if data type mismatch)
+                    merge_column_metadata(
+                        column_metadata_dict=column_metadata_dict,
+                        column_metadata_list=batch_column_metadata_list
+                    )
+
+                    # queue batch checkpoint (written once its upload finishes)
+                    pending_upload_list.append((
+                        upload_future,
+                        batch_number_fmt,
+                        {
+                            'start_idx': start_idx,
+                            'end_idx': end_idx,
+                            'object_path': cloudstorage_object_path,
+                            'column_metadata_list': batch_column_metadata_list,
+                        },
+                    ))
+
+                else:
+
+                    # queue batch checkpoint (no object to upload, so the batch is not scraped again on resume)
+                    empty_batch_future = Future()
+                    empty_batch_future.set_result(None)
+                    pending_upload_list.append((
+                        empty_batch_future,
+                        batch_number_fmt,
+                        {
+                            'start_idx': start_idx,
+                            'end_idx': end_idx,
+                            'object_path': None,
+                            'column_metadata_list': [],
+                        },
+                    ))
+
+                # checkpoint finished uploads (waits on the oldest upload if the queue is full)
+                checkpoint_uploaded_batches(
+                    pending_upload_list=pending_upload_list,
+                    max_pending_count=source_load_upload_queue_size,
+                    checkpoint_dict=checkpoint_dict,
+                    bucket_name=cloudstorage_bucket_name,
+                    checkpoint_object_path=cloudstorage_checkpoint_object_path
+                )
+
+            # wait for remaining uploads
+            checkpoint_uploaded_batches(
+                pending_upload_list=pending_upload_list,
+                max_pending_count=0,
+                checkpoint_dict=checkpoint_dict,
+                bucket_name=cloudstorage_bucket_name,
+                checkpoint_object_path=cloudstorage_checkpoint_object_path
+            )
+
+        # stream records to temp/target table (commits atomically, no cloud storage objects or load job)
+        if storage_write_flag:
+            if storage_write_record_list:
+                load_target_table_with_storage_write_api(
+                    record_list=storage_write_record_list,
+                    target_project_id=bigquery_target_project_id,
+                    target_dataset_id=bigquery_target_dataset_id,
+                    target_table_id=bigquery_target_table_id,
+                    temp_project_id=bigquery_temp_project_id,
+                    temp_dataset_id=bigquery_temp_dataset_id,
+                    temp_table_id=bigquery_temp_table_id,
+                    unique_column_name_list=unique_column_name_list,
+                    scd2_apply_mode=bigquery_scd2_apply_mode,
+                    partition_column_name=bigquery_target_partition_column_name,
+                    partition_type=bigquery_target_partition_type,
+                    cluster_column_name_list=bigquery_target_cluster_column_name_list
+                )
+            else:
+                logging.info(f"No data ingested into BigQuery.")
+            return
 
         # convert column metadata to list
         column_metadata_list = list(column_metadata_dict.values())
         logging.info(f"Column metadata: {column_metadata_list}")
 
-        # convert column metadata to bigquery schema field
-        schema_field_list = []
-        for column_metadata_dict in column_metadata_list:
-            # initialize/construct bigquery SchemaField
-            schema_field_dict = {}
-            schema_field_dict['name'] = column_metadata_dict['column_name']
-            schema_field_dict['field_type'] = column_metadata_dict['bigquery_data_type']
-
-            # append to list
-            schema_field_bigquery_object = create_schema_field(
-                schema_field_dict=schema_field_dict
+        # with multiple tasks, only the last task to finish loads bigquery
+        if task_count > 1:
+
+            # mark this task as done (with its column metadata)
+            write_json_to_cloud_storage(
+                data={
+                    'task_index': task_index,
+                    'url_count': url_list_len,
+                    'column_metadata_list': column_metadata_list,
+                },
+                bucket_name=cloudstorage_bucket_name,
+                object_path=f"{cloudstorage_task_folder_name}/task__{task_index_fmt}.json"
             )
-            schema_field_list.append(schema_field_bigquery_object)
-
-        logging.info(f"BigQuery column SchemaField list: {schema_field_list}.")
 
+            # check if all tasks are done
+            task_object_list = get_cloud_storage_objects(
+                bucket_name=cloudstorage_bucket_name,
+                prefix=f"{cloudstorage_task_folder_name}/task__"
+            )
+            if len(task_object_list) < task_count:
+                logging.info(f"{len(task_object_list)} of {task_count} tasks done - leaving BigQuery load to the last task.")
+                return
+
+            # claim the bigquery load (tasks finishing at the same time can all see every task done)
+            # a claim left by an earlier attempt of this task (ex. killed mid load) is taken over
+            cloudstorage_coordinator_object_path = f"{cloudstorage_task_folder_name}/coordinator.json"
+            coordinator_claimed_flag = write_json_to_cloud_storage(
+                data={'task_index': task_index},
+                bucket_name=cloudstorage_bucket_name,
+                object_path=cloudstorage_coordinator_object_path,
+                if_generation_match=0
+            )
+            if coordinator_claimed_flag == False:
+                coordinator_dict = read_json_from_cloud_storage(
+                    bucket_name=cloudstorage_bucket_name,
+                    object_path=cloudstorage_coordinator_object_path
+                )
+                if coordinator_dict is None or coordinator_dict['task_index'] != task_index:
+                    logging.info(f"BigQuery load already claimed by another task.")
+                    return
+                logging.info(f"BigQuery load already claimed by an earlier attempt of this task - resuming.")
+                coordinator_claimed_flag = True
+
+            logging.info(f"All {task_count} tasks done - task {task_index} loading BigQuery.")
+
+            # merge column metadata of all tasks
+            column_metadata_dict = {}
+            for task_object_dict in sorted(task_object_list, key=lambda task_object_dict: task_object_dict['name']):
+                task_dict = read_json_from_cloud_storage(
+                    bucket_name=cloudstorage_bucket_name,
+                    object_path=task_object_dict['name']
+                )
+                merge_column_metadata(
+                    column_metadata_dict=column_metadata_dict,
+                    column_metadata_list=task_dict['column_metadata_list']
+                )
+            column_metadata_list = list(column_metadata_dict.values())
+            logging.info(f"Column metadata (all tasks): {column_metadata_list}")
 
         # check cloud storage file(s) existence
         cloud_storage_objects_list = get_cloud_storage_objects(
@@ -165,97 +571,57 @@ def main(
 
         if cloud_storage_objects_exists_flag == True:
 
-            # check target table existence
-            target_table_exists_flag = check_table_existence(
-                project_id=bigquery_target_project_id,
-                dataset_id=bigquery_target_dataset_id,
-                table_id=bigquery_target_table_id
+            # load objects into target table (via temp table if target table exists)
+            load_target_table_with_cloud_storage(
+                cloudstorage_bucket_name=cloudstorage_bucket_name,
+                cloudstorage_object_pattern=cloudstorage_to_bigquery_object_pattern,
+                target_project_id=bigquery_target_project_id,
+                target_dataset_id=bigquery_target_dataset_id,
+                target_dataset_location=bigquery_target_dataset_location,
+                target_table_id=bigquery_target_table_id,
+                temp_project_id=bigquery_temp_project_id,
+                temp_dataset_id=bigquery_temp_dataset_id,
+                temp_dataset_location=bigquery_temp_dataset_location,
+                temp_table_id=bigquery_temp_table_id,
+                unique_column_name_list=unique_column_name_list,
+                column_metadata_list=column_metadata_list,
+                source_format='PARQUET' if cloudstorage_file_format == 'parquet' else 'NEWLINE_DELIMITED_JSON',
+                scd2_apply_mode=bigquery_scd2_apply_mode,
+                temp_table_type=bigquery_temp_table_type,
+                partition_column_name=bigquery_target_partition_column_name,
+                partition_type=bigquery_target_partition_type,
+                cluster_column_name_list=bigquery_target_cluster_column_name_list
             )
 
-            if target_table_exists_flag == True:
-
-                # drop temp table
-                drop_table(
-                    project_id=bigquery_temp_project_id,
-                    dataset_id=bigquery_temp_dataset_id,
-                    table_id=bigquery_temp_table_id
-                )
-
-                # create temp table
-                create_table_with_cloud_storage(
-                    cloudstorage_bucket_name=cloudstorage_bucket_name,
-                    cloudstorage_object_pattern=cloudstorage_to_bigquery_object_pattern,
-                    bigquery_project_id=bigquery_temp_project_id,
-                    bigquery_dataset_id=bigquery_temp_dataset_id,
-                    bigquery_dataset_location=bigquery_temp_dataset_location,
-                    bigquery_table_id=bigquery_temp_table_id,
-                    bigquery_schema_field_list=schema_field_list
-                )
-                
-                # alter target table
-                alter_target_table(
-                    target_project_id=bigquery_target_project_id,
-                    target_dataset_id=bigquery_target_dataset_id,
-                    target_table_id=bigquery_target_table_id,
-                    source_project_id=bigquery_temp_project_id,
-                    source_dataset_id=bigquery_temp_dataset_id,
-                    source_table_id=bigquery_temp_table_id,
-                    unique_column_name_list=unique_column_name_list
-                )
-
-                # update target table
-                update_target_table(
-                    target_project_id=bigquery_target_project_id,
-                    target_dataset_id=bigquery_target_dataset_id,
-                    target_table_id=bigquery_target_table_id,
-                    source_project_id=bigquery_temp_project_id,
-                    source_dataset_id=bigquery_temp_dataset_id,
-                    source_table_id=bigquery_temp_table_id,
-                    unique_column_name_list=unique_column_name_list
-                )
-
-                # insert
-                insert_target_table(
-                    target_project_id=bigquery_target_project_id,
-                    target_dataset_id=bigquery_target_dataset_id,
-                    target_table_id=bigquery_target_table_id,
-                    source_project_id=bigquery_temp_project_id,
-                    source_dataset_id=bigquery_temp_dataset_id,
-                    source_table_id=bigquery_temp_table_id,
-                    unique_column_name_list=unique_column_name_list
-                )
-
-                # drop temp table
-                drop_table(
-                    project_id=bigquery_temp_project_id,
-                    dataset_id=bigquery_temp_dataset_id,
-                    table_id=bigquery_temp_table_id
-                )
-            
-            else:
-                # otherwise create/load target table
-                create_table_with_cloud_storage(
-                    cloudstorage_bucket_name=cloudstorage_bucket_name,
-                    cloudstorage_object_pattern=cloudstorage_to_bigquery_object_pattern,
-                    bigquery_project_id=bigquery_target_project_id,
-                    bigquery_dataset_id=bigquery_target_dataset_id,
-                    bigquery_dataset_location=bigquery_target_dataset_location,
-                    bigquery_table_id=bigquery_target_table_id,
-                    bigquery_schema_field_list=schema_field_list
-                )
-                # add audit columns
-                add_audit_columns(
-                    project_id=bigquery_target_project_id,
-                    dataset_id=bigquery_target_dataset_id,
-                    table_id=bigquery_target_table_id
-                )
+            # clear checkpoints (a later run today scrapes again instead of reloading these objects)
+            delete_cloud_storage_objects(
+                bucket_name=cloudstorage_bucket_name,
+                prefix=f"{cloudstorage_checkpoint_folder_name}/"
+            )
 
         else:
             logging.info(f"No data ingested into Cloud Storage.")
 
+        # clear task markers and claim (only once bigquery is loaded)
+        if task_count > 1:
+            delete_cloud_storage_objects(
+                bucket_name=cloudstorage_bucket_name,
+                prefix=f"{cloudstorage_task_folder_name}/"
+            )
+
     except Exception as e:
         logging.error(f"Error with ingestion process for {bigquery_target_table_id}: {e}")
 
+        # release the bigquery load claim so the retried task (whose done marker is kept) can claim it again
+        if coordinator_claimed_flag == True:
+            delete_cloud_storage_object(
+                bucket_name=cloudstorage_bucket_name,
+                object_name=cloudstorage_coordinator_object_path
+            )
+
+        # fail the task (cloud run retries it, resuming from its checkpoint)
+        raise
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--bigquery_target_table_id', required=True, help='BigQuery target table ID from control table')
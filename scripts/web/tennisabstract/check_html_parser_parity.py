@@ -0,0 +1,128 @@
+from bs4 import (
+    BeautifulSoup,
+    FeatureNotFound,
+)
+from scripts.web.tennisabstract.matches.get_url_list import (
+    main as get_match_url_list,
+    parse_match_url_suffix_list,
+)
+from scripts.web.tennisabstract.matches.parse_match_html import parse_match_html
+from scripts.web.tennisabstract.tournaments.get_url_list import get_tournament_url_list_from_matches
+from scripts.web.tennisabstract.tournaments.parse_tournament_html import parse_tournament_html
+from utils.web.make_request import make_request
+import argparse
+import logging
+import os
+import sys
+
+# page folder (under the saved page folder) -> function parsing a page of it
+parse_function_dict = {
+    'match_list': lambda html, backend: parse_match_url_suffix_list(match_list_html=html, backend=backend),
+    'matches': lambda html, backend: parse_match_html(match_html=html, backend=backend),
+    'tournaments': lambda html, backend: parse_tournament_html(tournament_html=html, backend=backend),
+}
+
+def save_pages(
+    page_folder_name: str,
+    sample_count: int
+):
+    """
+    Arguments:
+    - page_folder_name: Local folder to save pages to
+    - sample_count: Number of match and tournament pages to save
+
+    Saves the charting (match list) page and the first sample_count match and tournament pages.
+    """
+
+    match_list_url = 'https://www.tennisabstract.com/charting/'
+    match_url_list = get_match_url_list()
+    tournament_url_list = get_tournament_url_list_from_matches(match_url_list=match_url_list)
+
+    page_url_dict = {
+        'match_list': [match_list_url],
+        'matches': [match_url_dict['match_url'] for match_url_dict in match_url_list[:sample_count]],
+        'tournaments': [tournament_url_dict['tournament_url'] for tournament_url_dict in tournament_url_list[:sample_count]],
+    }
+
+    for page_type, url_list in page_url_dict.items():
+        os.makedirs(os.path.join(page_folder_name, page_type), exist_ok=True)
+        for page_index, url in enumerate(url_list):
+            response = make_request(url=url)
+            with open(os.path.join(page_folder_name, page_type, f"{page_index:04d}.html"), 'w', encoding='utf-8') as f:
+                f.write(response.text)
+        logging.info(f"Saved {len(url_list)} {page_type} pages.")
+
+def main(
+    page_folder_name: str,
+    backend: str = 'lxml',
+    save_sample_count: int = 0
+) -> int:
+    """
+    Arguments:
+    - page_folder_name: Local folder of saved pages (subfolders: match_list, matches, tournaments)
+    - backend: HTML parser backend to compare against html.parser
+    - save_sample_count: (optional) Save this many match and tournament pages (and the match list page) first
+
+    Parses every saved page with html.parser and with backend and logs each value that differs.
+    Returns number of pages with differences (0 means backend can be switched on).
+    Players/players_classic pages are read with javascript variable scraping (no HTML parser), so are not checked.
+    """
+
+    # set logging config
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+
+    # create_soup falls back to html.parser when a backend is not installed (which would always match)
+    try:
+        BeautifulSoup('', backend)
+    except FeatureNotFound:
+        logging.error(f"HTML parser backend {backend} is not installed.")
+        raise
+
+    if save_sample_count > 0:
+        save_pages(
+            page_folder_name=page_folder_name,
+            sample_count=save_sample_count
+        )
+
+    page_count = 0
+    mismatch_page_count = 0
+    for page_type, parse_function in parse_function_dict.items():
+
+        page_type_folder_name = os.path.join(page_folder_name, page_type)
+        if not os.path.isdir(page_type_folder_name):
+            logging.warning(f"No saved {page_type} pages in {page_type_folder_name}.")
+            continue
+
+        for page_file_name in sorted(os.listdir(page_type_folder_name)):
+            with open(os.path.join(page_type_folder_name, page_file_name), encoding='utf-8') as f:
+                html = f.read()
+
+            page_count += 1
+            expected_value = parse_function(html, 'html.parser')
+            actual_value = parse_function(html, backend)
+            if actual_value != expected_value:
+                mismatch_page_count += 1
+                logging.error(
+                    f"{page_type}/{page_file_name}: {backend} differs from html.parser "
+                    f"(html.parser: {expected_value!r}, {backend}: {actual_value!r})."
+                )
+
+    logging.info(f"{backend} differs from html.parser on {mismatch_page_count} of {page_count} pages.")
+
+    return mismatch_page_count
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--page_folder_name', required=True, help='Local folder of saved pages (subfolders: match_list, matches, tournaments)')
+    parser.add_argument('--backend', default='lxml', help='HTML parser backend to compare against html.parser')
+    parser.add_argument('--save_sample_count', type=int, default=0, help='Save this many match and tournament pages first')
+    args = parser.parse_args()
+    mismatch_page_count = main(
+        page_folder_name=args.page_folder_name,
+        backend=args.backend,
+        save_sample_count=args.save_sample_count
+    )
+    sys.exit(1 if mismatch_page_count > 0 else 0)
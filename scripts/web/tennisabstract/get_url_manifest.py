@@ -0,0 +1,121 @@
+from datetime import datetime
+from scripts.web.tennisabstract.matches.get_url_list import (
+    main as get_match_url_list,
+)
+from scripts.web.tennisabstract.players.get_url_list import (
+    get_player_url_list_from_matches,
+)
+from scripts.web.tennisabstract.players_classic.get_url_list import (
+    get_player_classic_url_list_from_matches,
+)
+from scripts.web.tennisabstract.tournaments.get_url_list import (
+    get_tournament_url_list_from_matches,
+)
+from typing import (
+    Dict,
+    List,
+)
+from utils.cloud_storage.read_json_from_cloud_storage import read_json_from_cloud_storage
+from utils.cloud_storage.write_json_to_cloud_storage import write_json_to_cloud_storage
+import argparse
+import logging
+
+def create_url_manifest() -> Dict[str, List[Dict]]:
+    """
+    Fetches the charting (matches) page once and returns url lists for every entity derived from it.
+    """
+
+    match_url_list = get_match_url_list()
+
+    url_manifest = {
+        'matches': match_url_list,
+        'players': get_player_url_list_from_matches(match_url_list=match_url_list),
+        'players_classic': get_player_classic_url_list_from_matches(match_url_list=match_url_list),
+        'tournaments': get_tournament_url_list_from_matches(match_url_list=match_url_list),
+    }
+
+    return url_manifest
+
+def get_url_manifest(
+    bucket_name: str,
+    folder_name: str,
+    run_date_str: str
+) -> Dict[str, List[Dict]]:
+    """
+    Arguments:
+    - bucket_name: Cloud Storage bucket name
+    - folder_name: Cloud Storage folder where manifests are stored
+    - run_date_str: Run date (YYYYMMDD)
+
+    Returns the url manifest (entity name: url list) for the run date.
+    The manifest is created (and written to Cloud Storage) by the first job of the day; later jobs read the same snapshot.
+    """
+
+    object_path = f"{folder_name}/{run_date_str}/url_manifest.json"
+
+    # read manifest if already created for run date
+    url_manifest = read_json_from_cloud_storage(
+        bucket_name=bucket_name,
+        object_path=object_path
+    )
+    if url_manifest is not None:
+        logging.info(f"Using url manifest gs://{bucket_name}/{object_path}.")
+        return url_manifest
+
+    # otherwise create manifest
+    logging.info(f"Creating url manifest gs://{bucket_name}/{object_path}.")
+    url_manifest = create_url_manifest()
+
+    # only write if no other job wrote it in the meantime (in which case, use theirs so all jobs share one snapshot)
+    written_flag = write_json_to_cloud_storage(
+        data=url_manifest,
+        bucket_name=bucket_name,
+        object_path=object_path,
+        if_generation_match=0
+    )
+    if not written_flag:
+        url_manifest = read_json_from_cloud_storage(
+            bucket_name=bucket_name,
+            object_path=object_path
+        )
+
+    return url_manifest
+
+def main(
+    bucket_name: str,
+    folder_name: str
+):
+    """
+    Arguments:
+    - bucket_name: Cloud Storage bucket name
+    - folder_name: Cloud Storage folder where manifests are stored
+
+    Creates today's url manifest (if it does not exist) ahead of the entity ingest jobs.
+    """
+
+    # set logging config
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+
+    today_str = datetime.now().strftime("%Y%m%d")
+
+    url_manifest = get_url_manifest(
+        bucket_name=bucket_name,
+        folder_name=folder_name,
+        run_date_str=today_str
+    )
+
+    for entity_name, url_list in url_manifest.items():
+        logging.info(f"Url manifest contains {len(url_list)} {entity_name} urls.")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bucket_name', required=True, help='Cloud Storage bucket name')
+    parser.add_argument('--folder_name', required=True, help='Cloud Storage folder where manifests are stored')
+    args = parser.parse_args()
+    main(
+        bucket_name=args.bucket_name,
+        folder_name=args.folder_name
+    )
\ No newline at end of file
@@ -4,33 +4,39 @@ from typing import (
     Dict,
     List,
 )
+from utils.web.scrape_url_list import scrape_url_list
+from utils.web.scrape_url_list_default_config import scrape_url_list_default_config
 import logging
 
-def main(
-    url_list: List[Dict]
-) -> DataFrame:
+def get_data_list(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds']
+) -> List[Dict]:
     """
     Arguments:
     - url_list: List of match urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
 
-    Create list of match data from list of match urls.
+    Returns list of match data (url data combined with scraped data) from list of match urls.
     """
 
     try:
 
+        # scrape match urls concurrently (results are returned in url list order)
+        match_scrape_dict_list = scrape_url_list(
+            url_list=[match_dict['match_url'] for match_dict in url_list],
+            scrape_function=get_match_data_scraped,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+
         # loop through match urls
         match_data_list = []
-        for i, match_dict in enumerate(url_list):
+        for match_dict, match_scrape_dict in zip(url_list, match_scrape_dict_list):
 
             match_url = match_dict['match_url']
-            logging.info(f"({i+1}/{len(url_list)}) Getting match data for match url: {match_url}")
-
-            # get data from match scraping
-            match_scrape_dict = get_match_data_scraped(
-                match_url=match_url,
-                retries=3,
-                delay=3
-            )
 
             # continue with match data logic if data is returned from scraping
             if match_scrape_dict != {}:
@@ -46,6 +52,35 @@ def main(
                 # append to list
                 match_data_list.append(match_data_dict)
 
+        return match_data_list
+
+    except Exception as e:
+        logging.error(f"Error when getting match data: {e}.")
+        return []
+
+def main(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds']
+) -> DataFrame:
+    """
+    Arguments:
+    - url_list: List of match urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+
+    Create dataframe of match data (all values stringified) from list of match urls.
+    """
+
+    try:
+
+        # get list of match data
+        match_data_list = get_data_list(
+            url_list=url_list,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+
         # check if list is not empty
         if match_data_list != []:
 
@@ -57,6 +92,8 @@ def main(
 
             return match_data_df
 
+        return DataFrame()
+
     except Exception as e:
         logging.error(f"Error when getting match data: {e}.")
         return DataFrame()
\ No newline at end of file
@@ -0,0 +1,33 @@
+import pyarrow as pa
+
+def main() -> pa.Schema:
+    """
+    Returns Arrow schema of match data (url data combined with scraped data), used for Parquet staging.
+    Values that cannot be parsed into a numeric/date/boolean field are staged as null.
+    """
+
+    match_pointlog_type = pa.list_(
+        pa.struct([
+            ('point_number', pa.int64()),
+            ('server', pa.string()),
+            ('sets', pa.string()),
+            ('games', pa.string()),
+            ('points', pa.string()),
+            ('point_description', pa.string()),
+        ])
+    )
+
+    return pa.schema([
+        # url data
+        ('match_url', pa.string()),
+        ('match_date', pa.date32()),
+        ('match_gender', pa.string()),
+        ('match_tournament', pa.string()),
+        ('match_round', pa.string()),
+        ('match_player_one', pa.string()),
+        ('match_player_two', pa.string()),
+        # scraped data
+        ('match_title', pa.string()),
+        ('match_result', pa.string()),
+        ('match_pointlog', match_pointlog_type),
+    ])
\ No newline at end of file
@@ -1,10 +1,39 @@
-from bs4 import BeautifulSoup
 from scripts.web.tennisabstract.matches.create_match_url import create_match_url
+from datetime import (
+    datetime,
+    timedelta,
+)
 from typing import (
     Dict,
     List,
+    Optional,
+    Set,
 )
+from utils.web.create_soup import create_soup
 from utils.web.make_request import make_request
+import logging
+
+# column (in url dicts and target table) that identifies an already ingested match
+incremental_column_name = 'match_url'
+
+def parse_match_url_suffix_list(
+    match_list_html: str,
+    backend: Optional[str] = None
+) -> List[str]:
+    """
+    Arguments:
+    - match_list_html: HTML string of the charting (match list) page
+    - backend: (optional) HTML parser backend; defaults to the configured backend
+
+    Returns list of match url suffixes (hrefs in the last <p>) parsed from the page HTML.
+    """
+
+    soup = create_soup(html=match_list_html, backend=backend)
+
+    # links are hrefs in last <p>
+    p_tag_match = soup.find_all('p')[-1]
+
+    return [a['href'] for a in p_tag_match.find_all('a', href=True)]
 
 def main() -> List[Dict]:
     """
@@ -16,20 +45,15 @@ def main() -> List[Dict]:
     response = make_request(url=match_list_url)
 
     # parse page source
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    # links are hrefs in last <p>
-    p_tag_match = soup.find_all('p')[-1]
+    match_url_suffix_list = parse_match_url_suffix_list(match_list_html=response.text)
 
     # construct list of dicts
     match_url_list = []
-    for a in p_tag_match.find_all('a', href=True):
+    for match_url_suffix in match_url_suffix_list:
 
         # initialize dict
         match_url_dict = {}
 
-        match_url_suffix = a['href']
-        
         # create match url
         match_url = create_match_url(match_url_suffix=match_url_suffix)
         match_url_dict['match_url'] = match_url
@@ -51,4 +75,30 @@ def main() -> List[Dict]:
 
         match_url_list.append(match_url_dict)
 
-    return match_url_list
\ No newline at end of file
+    return match_url_list
+
+def get_incremental_url_list(
+    url_list: List[Dict],
+    ingested_url_set: Set[str],
+    window_days: int = 0
+) -> List[Dict]:
+    """
+    Arguments:
+    - url_list: List of match urls (from main)
+    - ingested_url_set: Set of match urls already loaded to the target table
+    - window_days: Number of days (counting back from today) for which already loaded matches are rescraped
+
+    Returns list of match urls that are new or fall within the rolling window.
+    """
+
+    window_start_date_str = (datetime.now() - timedelta(days=window_days)).strftime("%Y%m%d")
+
+    incremental_url_list = [
+        match_url_dict for match_url_dict in url_list
+        if match_url_dict[incremental_column_name] not in ingested_url_set
+        or (window_days > 0 and match_url_dict['match_date'] >= window_start_date_str)
+    ]
+
+    logging.info(f"Incremental match url list: {len(incremental_url_list)} of {len(url_list)} urls (window: {window_days} days).")
+
+    return incremental_url_list
\ No newline at end of file
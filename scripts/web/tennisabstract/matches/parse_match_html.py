@@ -0,0 +1,41 @@
+from typing import (
+    Dict,
+    Optional,
+)
+from utils.web.create_soup import create_soup
+import logging
+import re
+
+def parse_match_html(
+    match_html: str,
+    backend: Optional[str] = None
+) -> Dict:
+    """
+    Arguments:
+    - match_html: HTML string of a match page
+    - backend: (optional) HTML parser backend; defaults to the configured backend
+
+    Returns dictionary of match information parsed from the page HTML (match_title, match_result).
+    """
+
+    match_dict = {}
+
+    soup = create_soup(html=match_html, backend=backend)
+
+    # get the match title (<title>): <match info>: <player1> vs <player2> Detailed Stats | Tennis Abstract
+    try:
+        match_title = soup.find('title').text.split(' Detailed Stats | Tennis Abstract')[0]
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable `match_title`: {e}.")
+        match_title = None
+    match_dict["match_title"] = match_title
+
+    # get the match result (b): <winner> d. <loser> score
+    try:
+        match_result = soup.find('b', string=re.compile(r".+\sd\.\s.+\s.+")).text
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable `match_result`: {e}.")
+        match_result = None
+    match_dict["match_result"] = match_result
+
+    return match_dict
@@ -1,10 +1,19 @@
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
 from typing import (
     Dict,
     List,
 )
 import logging
 
+# elements that never wrap content (so are never pushed onto the open element stack)
+void_tag_set = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+}
+
+# elements whose text is not part of the cell text
+skip_text_tag_set = {'script', 'style', 'template'}
+
 def parse_match_pointlog(
         pointlog_html: str
 ) -> List[Dict]:
@@ -12,33 +21,76 @@ def parse_match_pointlog(
     Arguments:
     - pointlog_html: HTML string containing pointlog data
 
-    Parses HTML and returns list of point dictionaries.
+    Parses HTML in a single streaming pass (no tree is built) and returns list of point dictionaries.
     """
 
     try:
 
         point_data_list = []
-        
-        # extract the data (after 1st tr - headers)
-        pointlog_soup = BeautifulSoup(pointlog_html, 'html.parser')
-        pointlog_tr_list = pointlog_soup.find_all('tr')[1:]
-
-        # filter out empty rows
-        pointlog_tr_list = [
-            tr for tr in pointlog_tr_list 
-            if all(td.get_text(strip=True) for td in tr.find_all('td'))
-        ]
-
-        # loop through tr list
-        for index, tr in enumerate(pointlog_tr_list):
-            tr_td_list = tr.find_all('td')
+
+        # rows in document order: each row is a list of cells, each cell is a list of stripped text chunks
+        tr_list = []
+
+        # open element stack: (tag, row or cell being filled)
+        open_element_list = []
+
+        def handle_starttag(tag, attrs):
+            if tag in void_tag_set:
+                return
+            if tag == 'tr':
+                tr = []
+                tr_list.append(tr)
+                open_element_list.append((tag, tr))
+            elif tag == 'td':
+                td = []
+                # cells belong to every enclosing row (matches find_all('td') on each tr)
+                for open_tag, open_element in open_element_list:
+                    if open_tag == 'tr':
+                        open_element.append(td)
+                open_element_list.append((tag, td))
+            else:
+                open_element_list.append((tag, None))
+
+        def handle_endtag(tag):
+            # close the most recent matching element (and anything left open inside it)
+            for index in range(len(open_element_list) - 1, -1, -1):
+                if open_element_list[index][0] == tag:
+                    del open_element_list[index:]
+                    break
+
+        def handle_data(data):
+            # strip each text chunk (matches get_text(strip=True))
+            data = data.strip()
+            if not data:
+                return
+            if any(open_tag in skip_text_tag_set for open_tag, _ in open_element_list):
+                return
+            # text belongs to every enclosing cell
+            for open_tag, open_element in open_element_list:
+                if open_tag == 'td':
+                    open_element.append(data)
+
+        pointlog_parser = HTMLParser(convert_charrefs=True)
+        pointlog_parser.handle_starttag = handle_starttag
+        pointlog_parser.handle_endtag = handle_endtag
+        pointlog_parser.handle_data = handle_data
+        pointlog_parser.feed(pointlog_html)
+        pointlog_parser.close()
+
+        # loop through tr list (after 1st tr - headers), skipping rows with an empty cell
+        point_number = 0
+        for tr in tr_list[1:]:
+            tr_td_list = [''.join(td) for td in tr]
+            if not all(tr_td_list):
+                continue
+            point_number += 1
             point_data = {
-                'point_number': index + 1,
-                'server': tr_td_list[0].get_text(strip=True),
-                'sets': tr_td_list[1].get_text(strip=True),
-                'games': tr_td_list[2].get_text(strip=True),
-                'points': tr_td_list[3].get_text(strip=True),
-                'point_description': tr_td_list[4].get_text(strip=True),
+                'point_number': point_number,
+                'server': tr_td_list[0],
+                'sets': tr_td_list[1],
+                'games': tr_td_list[2],
+                'points': tr_td_list[3],
+                'point_description': tr_td_list[4],
             }
             point_data_list.append(point_data)
         return point_data_list
@@ -0,0 +1,45 @@
+import pyarrow as pa
+
+def main() -> pa.Schema:
+    """
+    Returns Arrow schema of player data (url data combined with scraped data), used for Parquet staging.
+    Values that cannot be parsed into a numeric/date/boolean field are staged as null.
+    """
+
+    return pa.schema([
+        # url data
+        ('player_url', pa.string()),
+        ('player_name', pa.string()),
+        ('player_gender', pa.string()),
+        # scraped data (javascript variables)
+        ('fullname', pa.string()),
+        ('lastname', pa.string()),
+        ('currentrank', pa.int64()),
+        ('peakrank', pa.int64()),
+        ('peakfirst', pa.date32()),
+        ('peaklast', pa.date32()),
+        ('dob', pa.date32()),
+        ('ht', pa.int64()),
+        ('hand', pa.string()),
+        ('backhand', pa.string()),
+        ('country', pa.string()),
+        ('shortlist', pa.string()),
+        ('careerjs', pa.string()),
+        ('active', pa.bool_()),
+        ('lastdate', pa.date32()),
+        ('twitter', pa.string()),
+        ('current_dubs', pa.int64()),
+        ('peak_dubs', pa.int64()),
+        ('peakfirst_dubs', pa.date32()),
+        ('liverank', pa.int64()),
+        ('chartagg', pa.string()),
+        ('photog', pa.string()),
+        ('photog_credit', pa.string()),
+        ('photog_link', pa.string()),
+        ('itf_id', pa.string()),
+        ('atp_id', pa.string()),
+        ('dc_id', pa.string()),
+        ('wiki_id', pa.string()),
+        ('elo_rating', pa.float64()),
+        ('elo_rank', pa.int64()),
+    ])
\ No newline at end of file
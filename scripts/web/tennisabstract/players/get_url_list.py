@@ -1,6 +1,7 @@
 from typing import (
     Dict,
     List,
+    Optional,
 )
 from scripts.web.tennisabstract.matches.get_url_list import (
     main as get_match_url_list,
@@ -63,13 +64,19 @@ def get_player_url_list() -> List[Dict]:
 
     return player_url_list
 
-def get_player_url_list_from_matches() -> List[Dict]:
+def get_player_url_list_from_matches(
+    match_url_list: Optional[List[Dict]] = None
+) -> List[Dict]:
     """
+    Arguments:
+    - match_url_list: (optional) Match url list (fetched from source if not passed)
+
     Returns list of player urls using the match url list.
     """
 
-    # get match url list
-    match_url_list = get_match_url_list()
+    # get match url list (if not passed)
+    if match_url_list is None:
+        match_url_list = get_match_url_list()
 
     # initialize player dicts
     player_url_list = []
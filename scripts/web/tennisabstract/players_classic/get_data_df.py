@@ -1,3 +1,4 @@
+from functools import partial
 from pandas import DataFrame
 from scripts.web.tennisabstract.players_classic.get_player_classic_data_scraped import (
     get_player_classic_data_scraped,
@@ -6,46 +7,44 @@ from typing import (
     Dict,
     List,
 )
+from utils.web.scrape_url_list import scrape_url_list
+from utils.web.scrape_url_list_default_config import scrape_url_list_default_config
 import logging
 
-def main(
-    url_list: List[Dict]
-) -> DataFrame:
+def get_data_list(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds'],
+    matchmx_columnar: bool = False
+) -> List[Dict]:
     """
     Arguments:
     - url_list: List of player urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+    - matchmx_columnar: Store matchmx as a dictionary of header: list of values instead of one dictionary per match
 
-    Create list of player data from list of player urls.
+    Returns list of player data (url data combined with scraped data) from list of player urls.
     """
 
-    # set logging config
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
-    )
-
     try:
 
+        # scrape player urls concurrently (results are returned in url list order)
+        player_classic_url_scrape_dict_list = scrape_url_list(
+            url_list=[player_dict['player_classic_url'] for player_dict in url_list],
+            scrape_function=partial(
+                get_player_classic_data_scraped,
+                matchmx_columnar=matchmx_columnar
+            ),
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+
         # loop through player urls
         player_data_list = []
-        for i, player_dict in enumerate(url_list):
+        for player_dict, player_classic_url_scrape_dict in zip(url_list, player_classic_url_scrape_dict_list):
 
             player_name = player_dict['player_name']
-            logging.info(f"({i+1}/{len(url_list)}) Getting player data for player: {player_name}.")
-
-            # get data from player scraping
-            try:
-                player_classic_url = player_dict['player_classic_url']
-                logging.info(f"Getting player data from {player_classic_url}.")
-                player_classic_url_scrape_dict = get_player_classic_data_scraped(
-                    player_classic_url=player_classic_url,
-                    retries=3,
-                    delay=1
-                )
-            
-            except Exception as e:
-                logging.info(f"Error getting player data from {player_classic_url}: {e}.")
-                player_classic_url_scrape_dict = {}
 
             # continue with player data logic if data is returned from scraping
             if player_classic_url_scrape_dict != {}:
@@ -61,6 +60,44 @@ def main(
                 # append to list
                 player_data_list.append(player_data_dict)
 
+        return player_data_list
+
+    except Exception as e:
+        logging.error(f"Error when getting player data: {e}.")
+        return []
+
+def main(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds'],
+    matchmx_columnar: bool = False
+) -> DataFrame:
+    """
+    Arguments:
+    - url_list: List of player urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+    - matchmx_columnar: Store matchmx as a dictionary of header: list of values instead of one dictionary per match
+
+    Create dataframe of player data (all values stringified) from list of player urls.
+    """
+
+    # set logging config
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+    )
+
+    try:
+
+        # get list of player data
+        player_data_list = get_data_list(
+            url_list=url_list,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds,
+            matchmx_columnar=matchmx_columnar
+        )
+
         # check if list is not empty
         if player_data_list != []:
 
@@ -72,6 +109,8 @@ def main(
 
             return player_data_df
 
+        return DataFrame()
+
     except Exception as e:
         logging.error(f"Error when getting player data: {e}.")
         return DataFrame()
\ No newline at end of file
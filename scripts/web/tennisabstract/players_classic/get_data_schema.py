@@ -0,0 +1,132 @@
+import pyarrow as pa
+
+# matchmx headers (see parse_player_classic_matchmx)
+matchmx_header_list = [
+        'date',
+        'tourn',
+        'surf',
+        'level',
+        'wl',
+        'rank',
+        'seed',
+        'entry',
+        'round',
+        'score',
+        'max',
+        'opp',
+        'orank',
+        'oseed',
+        'oentry',
+        'ohand',
+        'obday',
+        'oht',
+        'ocountry',
+        'oactive',
+        'time',
+        'aces',
+        'dfs',
+        'pts',
+        'firsts',
+        'fwon',
+        'swon',
+        'games',
+        'saved',
+        'chances',
+        'oaces',
+        'odfs',
+        'opts',
+        'ofirsts',
+        'ofwon',
+        'oswon',
+        'ogames',
+        'osaved',
+        'ochances',
+        'obackhand',
+        'chartlink',
+        'pslink',
+        'whserver',
+        'matchid',
+        'wh',
+        'roundnum',
+        'matchnum',
+]
+
+# matchmx headers with non-string values (dates as yyyymmdd, ranks, height, minutes and match stats); other headers are strings
+matchmx_header_data_type_dict = {
+    'date': pa.date32(),
+    'rank': pa.int64(),
+    'max': pa.int64(),
+    'orank': pa.int64(),
+    'obday': pa.date32(),
+    'oht': pa.int64(),
+    'time': pa.int64(),
+    **{
+        header: pa.int64()
+        for header in [
+            'aces', 'dfs', 'pts', 'firsts', 'fwon', 'swon', 'games', 'saved', 'chances',
+            'oaces', 'odfs', 'opts', 'ofirsts', 'ofwon', 'oswon', 'ogames', 'osaved', 'ochances',
+        ]
+    },
+}
+
+def main(
+    matchmx_columnar: bool = False
+) -> pa.Schema:
+    """
+    Arguments:
+    - matchmx_columnar: matchmx is stored as a dictionary of header: list of values instead of one dictionary per match
+
+    Returns Arrow schema of player data (url data combined with scraped data), used for Parquet staging.
+    Values that cannot be parsed into a numeric/date/boolean field (ex. '' for a missing stat) are staged as null.
+    """
+
+    # repeated struct (one per match) or struct of repeated values (one per header)
+    if matchmx_columnar:
+        matchmx_type = pa.struct([
+            (header, pa.list_(matchmx_header_data_type_dict.get(header, pa.string())))
+            for header in matchmx_header_list
+        ])
+    else:
+        matchmx_type = pa.list_(pa.struct([
+            (header, matchmx_header_data_type_dict.get(header, pa.string()))
+            for header in matchmx_header_list
+        ]))
+
+    return pa.schema([
+        # url data
+        ('player_classic_url', pa.string()),
+        ('player_name', pa.string()),
+        ('player_gender', pa.string()),
+        # scraped data (javascript variables)
+        ('fullname', pa.string()),
+        ('lastname', pa.string()),
+        ('currentrank', pa.int64()),
+        ('peakrank', pa.int64()),
+        ('peakfirst', pa.date32()),
+        ('peaklast', pa.date32()),
+        ('dob', pa.date32()),
+        ('ht', pa.int64()),
+        ('hand', pa.string()),
+        ('backhand', pa.string()),
+        ('country', pa.string()),
+        ('shortlist', pa.string()),
+        ('careerjs', pa.string()),
+        ('active', pa.bool_()),
+        ('lastdate', pa.date32()),
+        ('twitter', pa.string()),
+        ('current_dubs', pa.int64()),
+        ('peak_dubs', pa.int64()),
+        ('peakfirst_dubs', pa.date32()),
+        ('liverank', pa.int64()),
+        ('chartagg', pa.string()),
+        ('photog', pa.string()),
+        ('photog_credit', pa.string()),
+        ('photog_link', pa.string()),
+        ('itf_id', pa.string()),
+        ('atp_id', pa.string()),
+        ('dc_id', pa.string()),
+        ('wiki_id', pa.string()),
+        ('elo_rating', pa.float64()),
+        ('elo_rank', pa.int64()),
+        ('matchmx', matchmx_type),
+    ])
\ No newline at end of file
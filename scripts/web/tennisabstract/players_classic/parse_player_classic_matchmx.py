@@ -1,16 +1,22 @@
 from typing import (
+    Dict,
+    Iterable,
     List,
+    Union,
 )
+from utils.python.convert_rows_to_columns import convert_rows_to_columns
 import logging
 
 def parse_player_classic_matchmx(
-    player_matchmx_list: List[List]
-) -> str:
+    player_matchmx_list: Iterable[List],
+    columnar: bool = False
+) -> Union[List[Dict], Dict[str, List]]:
     """
     Arguments:
-    - player_matchmx_list: List of player matchmx data (as lists)
+    - player_matchmx_list: Iterable of player matchmx data (as lists), ex. rows streamed by iter_javascript_array
+    - columnar: Return a dictionary of header: list of values instead of one dictionary per match
 
-    Loops through list and returns list of player match dictionaries.
+    Loops through list and returns list of player match dictionaries (or matchmx columns if columnar).
     """
 
     try:
@@ -68,6 +74,12 @@ def parse_player_classic_matchmx(
             "matchnum": 47,
         }
         
+        # build columns directly (header keys are stored once rather than once per match)
+        if columnar:
+            return convert_rows_to_columns(
+                row_iterable=player_matchmx_list,
+                header_index_dict=matchmx_header_dict
+            )
 
         # loop through matchmx list
         matchmx_data_list = []
@@ -49,9 +49,7 @@ def get_player_jsmatches_data(
         #                 player_dict['player_jsmatches_url'] = player_jsmatches_url
         #                 logging.info(f"Getting player jsmatches data from {player_jsmatches_url}.")
         #                 player_jsmatches_url_scrape_dict = get_player_jsmatches_data_scraped(
-        #                     player_jsmatches_url=player_jsmatches_url,
-        #                     retries=3,
-        #                     delay=1
+        #                     player_jsmatches_url=player_jsmatches_url
         #                 )
                     
         #             except Exception as e:
@@ -67,9 +65,7 @@ def get_player_jsmatches_data(
         #                 player_dict['player_jsmatches_career_url'] = player_jsmatches_career_url
         #                 logging.info(f"Getting player jsmatches career data from {player_jsmatches_career_url}.")
         #                 player_jsmatches_career_url_scrape_dict = get_player_jsmatches_career_data_scraped(
-        #                     player_jsmatches_career_url=player_jsmatches_career_url,
-        #                     retries=3,
-        #                     delay=1
+        #                     player_jsmatches_career_url=player_jsmatches_career_url
         #                 )
                     
         #             except Exception as e:
@@ -85,6 +81,7 @@ def get_player_jsmatches_data(
         #                     player_jsmatches_url_scrape_dict['matchmx'] = combine_list_of_dicts(
         #                         player_jsmatches_url_scrape_dict['matchmx'],
         #                         player_jsmatches_career_url_scrape_dict['morematchmx'],
+        #                         key_list=['date', 'tourn', 'round', 'opp'],
         #                     )
 
         #             except Exception as e:
@@ -5,196 +5,124 @@ from typing import (
     Dict,
 )
 from utils.web.make_request import make_request
-from utils.web.scrape_javascript_var import (
-    scrape_javascript_multiline_var,
-    scrape_javascript_var,
+from utils.web.parse_javascript_array import iter_javascript_array
+from utils.web.scrape_javascript_vars import (
+    scrape_javascript_vars,
 )
-import ast
 import logging
-import time
 
 def get_player_jsmatches_data_scraped(
     player_jsmatches_url: str,
-    retries: int = 3,
-    delay: int = 3
+    matchmx_columnar: bool = False
 ) -> Dict:
     """
     Arguments:
     - player_jsmatches_url: player jsmatches link
-    - retries: Number of retry attempts
-    - delay: Time (in seconds) between retries
+    - matchmx_columnar: Return matchmx as a dictionary of header: list of values instead of one dictionary per match
 
-    Returns dictionary of player information from url
+    Returns dictionary of player information from url (empty if no variables are found).
+    Request retries/backoff are handled by make_request (shared per-host rate limiter); parse failures are not retried.
     """
 
-    # initialize data
-    player_dict = {}
-
-    attempt = 0
-
-    while attempt < retries:
-
-        try:
-
-            response_var_list = [
-                'nameparam', 'fullname', 'lastname', 'currentrank', 'peakrank', 'peakfirst', 'peaklast',
-                'dob', 'ht', 'hand', 'backhand', 'country', 'shortlist', 'careerjs', 'active', 'lastdate',
-                'twitter', 'current_dubs', 'peak_dubs', 'peakfirst_dubs', 'liverank', 'chartagg', 'photog', 'photog_credit', 'photog_link',
-                'itf_id', 'atp_id', 'dc_id', 'wta_id', 'fc_id', 'wiki_id', 'blast_link', 'more_link', 'death_date', 'dob_approx', 'elo_rating', 'elo_rank',
-                'matchmx',
-            ]
-            player_dict = {var: None for var in response_var_list}
-
-            # navigate to the page
-            response = make_request(url=player_jsmatches_url)
-            response_text = response.text
-            # soup = BeautifulSoup(response_text, 'html.parser')
-
-            for var in response_var_list:
-                try:
-                    # parse matchmx
-                    if var == 'matchmx':
-                        val = scrape_javascript_multiline_var(
-                            content=response_text,
-                            var=var
-                        )
-                        val = ast.literal_eval(val)
-                        val = parse_player_jsmatches_matchmx(player_matchmx_list=val)
-
-                    else:
-                        val = scrape_javascript_var(
-                            content=response_text,
-                            var=var
-                        )
-                        
-                    player_dict[var] = val
-                except Exception as e:
-                    logging.info(f"Error encountered when getting data for variable {var}: {e}")
-                    continue
-
-            # check if all values in dict are None
-            if all(value is None for value in player_dict.values()):
-                
-                logging.info(f"All values None for: {repr(player_jsmatches_url)}")
-                
-                # Log which variables were not found
-                missing_vars = [var for var, val in player_dict.items() if val is None]
-                logging.info(f"Missing variables: {missing_vars}")
-
-                attempt += 1
-                
-                # retry if possible
-                if attempt < retries:
-                    logging.info(f"Retrying in {delay} seconds...Attempt {attempt} for {player_jsmatches_url}")
-                    time.sleep(delay)
-                    continue
-                else:
-                    logging.info(f"Max retries reached for {player_jsmatches_url}...Returning empty dictionary")
-                return {}
-
-            # return dictionary if data successfully extracted
-            return player_dict
-
-        except Exception as e:
-            attempt += 1
-            logging.warning(f"Attempt {attempt} failed for {player_jsmatches_url}: {e}")
-
-            if attempt < retries:
-                logging.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)  # Delay before retrying
-            else:
-                logging.info(f"Max retries reached for {player_jsmatches_url}.")
-
-    # Return empty dictionary if all retries fail
-    logging.info(f"Returning empty dictionary")
-    return {}
+    response_var_list = [
+        'nameparam', 'fullname', 'lastname', 'currentrank', 'peakrank', 'peakfirst', 'peaklast',
+        'dob', 'ht', 'hand', 'backhand', 'country', 'shortlist', 'careerjs', 'active', 'lastdate',
+        'twitter', 'current_dubs', 'peak_dubs', 'peakfirst_dubs', 'liverank', 'chartagg', 'photog', 'photog_credit', 'photog_link',
+        'itf_id', 'atp_id', 'dc_id', 'wta_id', 'fc_id', 'wiki_id', 'blast_link', 'more_link', 'death_date', 'dob_approx', 'elo_rating', 'elo_rank',
+        'matchmx',
+    ]
+    player_dict = {var: None for var in response_var_list}
+
+    # navigate to the page
+    response = make_request(url=player_jsmatches_url)
+    response_text = response.text
+    # soup = BeautifulSoup(response_text, 'html.parser')
+
+    try:
+
+        # scrape all variables in one pass over the page (matchmx spans multiple lines)
+        response_var_dict = scrape_javascript_vars(
+            content=response_text,
+            var_list=[var for var in response_var_list if var != 'matchmx'],
+            multiline_var_list=['matchmx']
+        )
+
+        for var, val in response_var_dict.items():
+            try:
+                # parse matchmx
+                if var == 'matchmx':
+                    val = parse_player_jsmatches_matchmx(
+                        player_matchmx_list=iter_javascript_array(value=val),
+                        columnar=matchmx_columnar
+                    )
+
+                player_dict[var] = val
+            except Exception as e:
+                logging.info(f"Error encountered when getting data for variable {var}: {e}")
+                continue
+
+    except Exception as e:
+        logging.warning(f"Error parsing {player_jsmatches_url}: {e} - Returning empty dictionary.")
+        return {}
+
+    # check if all values in dict are None
+    if all(value is None for value in player_dict.values()):
+        logging.info(f"All values None for {repr(player_jsmatches_url)} - Returning empty dictionary.")
+        return {}
+
+    return player_dict
 
 def get_player_jsmatches_career_data_scraped(
     player_jsmatches_career_url: str,
-    retries: int = 3,
-    delay: int = 3
+    matchmx_columnar: bool = False
 ) -> Dict:
     """
     Arguments:
     - player_jsmatches_career_url: player jsmatches link
-    - retries: Number of retry attempts
-    - delay: Time (in seconds) between retries
+    - matchmx_columnar: Return matchmx as a dictionary of header: list of values instead of one dictionary per match
 
-    Returns dictionary of player information from url
+    Returns dictionary of player information from url (empty if no variables are found).
+    Request retries/backoff are handled by make_request (shared per-host rate limiter); parse failures are not retried.
     """
 
-    # initialize data
-    player_dict = {}
-
-    attempt = 0
-
-    while attempt < retries:
-
-        try:
-
-            response_var_list = ['morematchmx',]
-            player_dict = {var: None for var in response_var_list}
-
-            # navigate to the page
-            response = make_request(url=player_jsmatches_career_url)
-            response_text = response.text
-            # soup = BeautifulSoup(response_text, 'html.parser')
-
-            for var in response_var_list:
-                try:
-                    # parse matchmx
-                    if var == 'morematchmx':
-                        val = scrape_javascript_multiline_var(
-                            content=response_text,
-                            var=var
-                        )
-                        val = ast.literal_eval(val)
-                        val = parse_player_jsmatches_matchmx(player_matchmx_list=val)
-
-                    else:
-                        val = scrape_javascript_var(
-                            content=response_text,
-                            var=var
-                        )
-                        
-                    player_dict[var] = val
-                except Exception as e:
-                    logging.info(f"Error encountered when getting data for variable {var}: {e}")
-                    continue
-
-            # check if all values in dict are None
-            if all(value is None for value in player_dict.values()):
-                
-                logging.info(f"All values None for: {repr(player_jsmatches_career_url)}")
-                
-                # Log which variables were not found
-                missing_vars = [var for var, val in player_dict.items() if val is None]
-                logging.info(f"Missing variables: {missing_vars}")
-
-                attempt += 1
-                
-                # retry if possible
-                if attempt < retries:
-                    logging.info(f"Retrying in {delay} seconds...Attempt {attempt} for {player_jsmatches_career_url}")
-                    time.sleep(delay)
-                    continue
-                else:
-                    logging.info(f"Max retries reached for {player_jsmatches_career_url}...Returning empty dictionary")
-                return {}
-
-            # return dictionary if data successfully extracted
-            return player_dict
-
-        except Exception as e:
-            attempt += 1
-            logging.warning(f"Attempt {attempt} failed for {player_jsmatches_career_url}: {e}")
-
-            if attempt < retries:
-                logging.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)  # Delay before retrying
-            else:
-                logging.info(f"Max retries reached for {player_jsmatches_career_url}.")
-
-    # Return empty dictionary if all retries fail
-    logging.info(f"Returning empty dictionary")
-    return {}
\ No newline at end of file
+    response_var_list = ['morematchmx',]
+    player_dict = {var: None for var in response_var_list}
+
+    # navigate to the page
+    response = make_request(url=player_jsmatches_career_url)
+    response_text = response.text
+    # soup = BeautifulSoup(response_text, 'html.parser')
+
+    try:
+
+        # scrape all variables in one pass over the page (morematchmx spans multiple lines)
+        response_var_dict = scrape_javascript_vars(
+            content=response_text,
+            var_list=[var for var in response_var_list if var != 'morematchmx'],
+            multiline_var_list=['morematchmx']
+        )
+
+        for var, val in response_var_dict.items():
+            try:
+                # parse matchmx
+                if var == 'morematchmx':
+                    val = parse_player_jsmatches_matchmx(
+                        player_matchmx_list=iter_javascript_array(value=val),
+                        columnar=matchmx_columnar
+                    )
+
+                player_dict[var] = val
+            except Exception as e:
+                logging.info(f"Error encountered when getting data for variable {var}: {e}")
+                continue
+
+    except Exception as e:
+        logging.warning(f"Error parsing {player_jsmatches_career_url}: {e} - Returning empty dictionary.")
+        return {}
+
+    # check if all values in dict are None
+    if all(value is None for value in player_dict.values()):
+        logging.info(f"All values None for {repr(player_jsmatches_career_url)} - Returning empty dictionary.")
+        return {}
+
+    return player_dict
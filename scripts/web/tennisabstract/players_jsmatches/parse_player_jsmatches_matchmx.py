@@ -1,17 +1,22 @@
 from typing import (
     Dict,
+    Iterable,
     List,
+    Union,
 )
+from utils.python.convert_rows_to_columns import convert_rows_to_columns
 import logging
 
 def parse_player_jsmatches_matchmx(
-    player_matchmx_list: List[List]
-) -> List[Dict]:
+    player_matchmx_list: Iterable[List],
+    columnar: bool = False
+) -> Union[List[Dict], Dict[str, List]]:
     """
     Arguments:
-    - player_matchmx_list: List of player matchmx data (as lists)
+    - player_matchmx_list: Iterable of player matchmx data (as lists), ex. rows streamed by iter_javascript_array
+    - columnar: Return a dictionary of header: list of values instead of one dictionary per match
 
-    Loops through list and returns list of player match dictionaries.
+    Loops through list and returns list of player match dictionaries (or matchmx columns if columnar).
     """
 
     try:
@@ -25,6 +30,13 @@ def parse_player_jsmatches_matchmx(
             "chartlink", "pslink", "whserver", "matchid", "wh", "roundnum", "matchnum",
         ]
         
+        # build columns directly (header keys are stored once rather than once per match)
+        if columnar:
+            return convert_rows_to_columns(
+                row_iterable=player_matchmx_list,
+                header_index_dict={header: elem_index for elem_index, header in enumerate(matchmx_header_list)},
+                row_length=len(matchmx_header_list)
+            )
 
         # loop through matchmx list
         matchmx_data_list = []
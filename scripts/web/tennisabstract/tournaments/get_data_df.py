@@ -4,33 +4,39 @@ from typing import (
     Dict,
     List,
 )
+from utils.web.scrape_url_list import scrape_url_list
+from utils.web.scrape_url_list_default_config import scrape_url_list_default_config
 import logging
 
-def main(
-    url_list: List[Dict]
-) -> DataFrame:
+def get_data_list(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds']
+) -> List[Dict]:
     """
     Arguments:
     - url_list: List of tournament urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
 
-    Create list of tournament data from list of tournament urls.
+    Returns list of tournament data (url data combined with scraped data) from list of tournament urls.
     """
 
     try:
 
+        # scrape tournament urls concurrently (results are returned in url list order)
+        tournament_scrape_dict_list = scrape_url_list(
+            url_list=[tournament_dict['tournament_url'] for tournament_dict in url_list],
+            scrape_function=get_tournament_data_scraped,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+
         # loop through tournament urls
         tournament_data_list = []
-        for i, tournament_dict in enumerate(url_list):
+        for tournament_dict, tournament_scrape_dict in zip(url_list, tournament_scrape_dict_list):
 
             tournament_url = tournament_dict['tournament_url']
-            logging.info(f"({i+1}/{len(url_list)}) Getting tournament data for tournamnet url: {tournament_url}")
-
-            # get data from tournament scraping
-            tournament_scrape_dict = get_tournament_data_scraped(
-                tournament_url=tournament_url,
-                retries=3,
-                delay=3
-            )
 
             # continue with tournament data logic if data is returned from scraping
             if tournament_scrape_dict != {}:
@@ -46,6 +52,35 @@ def main(
                 # append to list
                 tournament_data_list.append(tournament_data_dict)
 
+        return tournament_data_list
+
+    except Exception as e:
+        logging.error(f"Error when getting tournament data: {e}.")
+        return []
+
+def main(
+    url_list: List[Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds']
+) -> DataFrame:
+    """
+    Arguments:
+    - url_list: List of tournament urls
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+
+    Create dataframe of tournament data (all values stringified) from list of tournament urls.
+    """
+
+    try:
+
+        # get list of tournament data
+        tournament_data_list = get_data_list(
+            url_list=url_list,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+
         # check if list is not empty
         if tournament_data_list != []:
 
@@ -57,6 +92,8 @@ def main(
 
             return tournament_data_df
 
+        return DataFrame()
+
     except Exception as e:
         logging.error(f"Error when getting tournament data: {e}.")
         return DataFrame()
\ No newline at end of file
@@ -0,0 +1,20 @@
+import pyarrow as pa
+
+def main() -> pa.Schema:
+    """
+    Returns Arrow schema of tournament data (url data combined with scraped data), used for Parquet staging.
+    Values that cannot be parsed into a numeric/date/boolean field are staged as null.
+    """
+
+    return pa.schema([
+        # url data
+        ('tournament_url', pa.string()),
+        ('tournament_year', pa.int64()),
+        ('tournament_gender', pa.string()),
+        ('tournament_name', pa.string()),
+        # scraped data
+        ('tournament_title', pa.string()),
+        ('tournament_start_date', pa.date32()),
+        ('tournament_surface', pa.string()),
+        ('tournament_draw_size', pa.int64()),
+    ])
\ No newline at end of file
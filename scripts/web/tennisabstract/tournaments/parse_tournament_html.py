@@ -0,0 +1,66 @@
+from typing import (
+    Dict,
+    Optional,
+)
+from utils.web.create_soup import create_soup
+import logging
+import re
+
+def parse_tournament_html(
+    tournament_html: str,
+    backend: Optional[str] = None
+) -> Dict:
+    """
+    Arguments:
+    - tournament_html: HTML string of a tournament page
+    - backend: (optional) HTML parser backend; defaults to the configured backend
+
+    Returns dictionary of tournament information parsed from the page HTML (title, start date, surface, draw size).
+    """
+
+    tournament_dict = {}
+
+    soup = create_soup(html=tournament_html, backend=backend)
+
+    # data is in the <p> tag with id 'biog'
+    biog_element = soup.find(id = 'biog')
+
+    # get the tournament title (<b>)
+    try:
+        tournament_title = biog_element.find('b').get_text(strip=True)
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable tournament_title: {e}")
+        tournament_title = None
+    tournament_dict["tournament_title"] = tournament_title
+
+    # get the tournament start date: <month> <dd>, <yyyy>
+    try:
+        date_regex = re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}')
+        date_node = biog_element.find(string=date_regex)
+        tournament_start_date = date_node.strip().split(' |')[0] # get rid of spaces and pipes
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable tournament_start_date: {e}")
+        tournament_start_date = None
+    tournament_dict["tournament_start_date"] = tournament_start_date
+
+    # get the tournament surface; Surface: {surface}
+    try:
+        surface_regex = re.compile(r'Surface: ([A-Za-z]+)')
+        surface_match = surface_regex.search(biog_element.get_text(separator=' ')) # use separator so that <br/> tags become spaces
+        tournament_surface = surface_match.group(1).strip()
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable tournament_surface: {e}")
+        tournament_surface = None
+    tournament_dict["tournament_surface"] = tournament_surface
+
+    # get the tournament draw size; Draw: {draw_size}
+    try:
+        draw_size_regex = re.compile(r'Draw: ([0-9]+)')
+        draw_size_match = draw_size_regex.search(biog_element.get_text(separator=' ')) # use separator so that <br/> tags become spaces
+        tournament_draw_size = draw_size_match.group(1).strip()
+    except Exception as e:
+        logging.info(f"Error encountered when getting data for variable tournament_draw_size: {e}")
+        tournament_draw_size = None
+    tournament_dict["tournament_draw_size"] = tournament_draw_size
+
+    return tournament_dict
@@ -29,7 +29,8 @@ def add_audit_columns(
             ADD COLUMN audit_column__end_datetime_utc TIMESTAMP,
             ADD COLUMN audit_column__insert_datetime_utc TIMESTAMP,
             ADD COLUMN audit_column__update_datetime_utc TIMESTAMP,
-            ADD COLUMN audit_column__delete_datetime_utc TIMESTAMP
+            ADD COLUMN audit_column__delete_datetime_utc TIMESTAMP,
+            ADD COLUMN audit_column__row_hash INT64
             ;
         """
         
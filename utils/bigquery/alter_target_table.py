@@ -32,6 +32,16 @@ def alter_target_table(
 
     # initialize client
     client = bigquery.Client()
+
+    # add the row content fingerprint column if missing (target tables created before it existed)
+    target_table = client.get_table(f"{target_project_id}.{target_dataset_id}.{target_table_id}")
+    if 'audit_column__row_hash' not in [schema_field.name for schema_field in target_table.schema]:
+        logging.info("Adding column `audit_column__row_hash` to target table.")
+        client.query(f"""
+            ALTER TABLE {target_project_id}.{target_dataset_id}.{target_table_id}
+            ADD COLUMN IF NOT EXISTS audit_column__row_hash INT64
+            ;
+        """).result()
     
     columns_compare_sql = f"""
     WITH
@@ -56,7 +66,8 @@ def alter_target_table(
             'audit_column__end_datetime_utc',
             'audit_column__insert_datetime_utc',
             'audit_column__update_datetime_utc',
-            'audit_column__delete_datetime_utc'
+            'audit_column__delete_datetime_utc',
+            'audit_column__row_hash'
             )
         ),
         
@@ -125,8 +136,16 @@ def alter_target_table(
                     AND {update_unique_column_where_clause}
                 ;
             """
+
+            # persisted fingerprints no longer cover the target columns (recomputed on the next update/merge)
+            alter_table_add_row_hash_sql = f"""
+                UPDATE {target_project_id}.{target_dataset_id}.{target_table_id}
+                SET audit_column__row_hash = NULL
+                WHERE audit_column__active_flag = true
+                ;
+            """
             try:
-                client.query(f"{alter_table_add_sql} {alter_table_add_update_sql}").result()
+                client.query(f"{alter_table_add_sql} {alter_table_add_update_sql} {alter_table_add_row_hash_sql}").result()
                 logging.info(f"Successfully added and populated column `{source_column_name}`.")
             except Exception as e:
                 logging.error(f"Failed to alter or update column `{source_column_name}`: {e}")
@@ -0,0 +1,116 @@
+from google.cloud import bigquery
+from typing import (
+    List,
+    Optional,
+)
+import logging
+
+# partition granularities supported per partition column data type
+partition_type_dict = {
+    'TIMESTAMP': ['HOUR', 'DAY', 'MONTH', 'YEAR'],
+    'DATETIME': ['HOUR', 'DAY', 'MONTH', 'YEAR'],
+    'DATE': ['DAY', 'MONTH', 'YEAR'],
+}
+
+def apply_target_table_partitioning(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    partition_column_name: Optional[str] = None,
+    partition_type: str = 'DAY',
+    cluster_column_name_list: Optional[List[str]] = None
+):
+    """
+    Arguments:
+    - project_id: Google Cloud project ID
+    - dataset_id: Dataset name
+    - table_id: Table name
+    - partition_column_name: (optional) DATE/DATETIME/TIMESTAMP column to partition by (e.g. audit_column__start_datetime_utc)
+    - partition_type: Partition granularity (HOUR, DAY, MONTH, YEAR; HOUR is not supported for DATE columns)
+    - cluster_column_name_list: (optional) Columns to cluster by, at most 4 (e.g. unique columns and audit_column__active_flag)
+
+    Partitions/clusters table if its current spec differs (no job if unchanged; unset arguments keep the current spec).
+    A partitioning change rewrites the table (CREATE OR REPLACE ... AS SELECT; description, labels and column descriptions are carried over),
+    a clustering only change updates table metadata
+    (existing data is reclustered by BigQuery in the background).
+    """
+
+    try:
+
+        # Construct a BigQuery client object.
+        client = bigquery.Client()
+
+        table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
+
+        # compare current spec (table metadata, no query job)
+        current_partition_column_name = table.time_partitioning.field if table.time_partitioning else None
+        current_partition_type = table.time_partitioning.type_ if table.time_partitioning else None
+        partition_change_flag = partition_column_name is not None and (
+            partition_column_name != current_partition_column_name or partition_type != current_partition_type
+        )
+        cluster_change_flag = cluster_column_name_list is not None and (table.clustering_fields or []) != cluster_column_name_list
+
+        # keep current clustering if not set
+        if cluster_column_name_list is None:
+            cluster_column_name_list = table.clustering_fields or []
+
+        if partition_change_flag:
+
+            # partition expression depends on column data type (and the granularities it supports)
+            column_data_type_dict = {schema_field.name: schema_field.field_type for schema_field in table.schema}
+            partition_column_data_type = column_data_type_dict.get(partition_column_name)
+            if partition_type not in partition_type_dict.get(partition_column_data_type, []):
+                logging.warning(
+                    f"Cannot partition `{project_id}.{dataset_id}.{table_id}` by `{partition_column_name}` "
+                    f"(data type: {partition_column_data_type}, partition type: {partition_type}). Skipping partitioning."
+                )
+                partition_sql = None
+            elif partition_column_data_type == 'TIMESTAMP':
+                partition_sql = f"TIMESTAMP_TRUNC({partition_column_name}, {partition_type})"
+            elif partition_column_data_type == 'DATETIME':
+                partition_sql = f"DATETIME_TRUNC({partition_column_name}, {partition_type})"
+            else:
+                partition_sql = partition_column_name if partition_type == 'DAY' else f"DATE_TRUNC({partition_column_name}, {partition_type})"
+
+            if partition_sql is not None:
+                cluster_sql = f"CLUSTER BY {', '.join(cluster_column_name_list)}" if cluster_column_name_list else ''
+                partition_table_sql = f"""
+                    CREATE OR REPLACE TABLE {project_id}.{dataset_id}.{table_id}
+                    PARTITION BY {partition_sql}
+                    {cluster_sql}
+                    AS SELECT * FROM {project_id}.{dataset_id}.{table_id}
+                    ;
+                """
+                logging.warning(
+                    f"Rewriting `{project_id}.{dataset_id}.{table_id}` (CREATE OR REPLACE) to partition by {partition_sql} "
+                    f"(clustering: {cluster_column_name_list}). The previous table is replaced (recoverable with time travel only)."
+                )
+                client.query(partition_table_sql).result()
+
+                # carry over table options the rewrite drops (description, labels, column descriptions)
+                column_description_dict = {
+                    schema_field.name: schema_field.description
+                    for schema_field in table.schema
+                    if schema_field.description
+                }
+                partitioned_table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
+                partitioned_table.description = table.description
+                partitioned_table.labels = table.labels
+                partitioned_schema_field_list = []
+                for schema_field in partitioned_table.schema:
+                    schema_field_dict = schema_field.to_api_repr()
+                    if schema_field.name in column_description_dict:
+                        schema_field_dict['description'] = column_description_dict[schema_field.name]
+                    partitioned_schema_field_list.append(bigquery.SchemaField.from_api_repr(schema_field_dict))
+                partitioned_table.schema = partitioned_schema_field_list
+                client.update_table(partitioned_table, ['description', 'labels', 'schema'])
+                return
+
+        if cluster_change_flag:
+            logging.info(f"Clustering `{project_id}.{dataset_id}.{table_id}` by {cluster_column_name_list}.")
+            table.clustering_fields = cluster_column_name_list or None
+            client.update_table(table, ['clustering_fields'])
+
+    except Exception as e:
+        logging.error(f"Error partitioning/clustering `{project_id}.{dataset_id}.{table_id}`: {e}.")
+        raise
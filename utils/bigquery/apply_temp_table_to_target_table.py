@@ -0,0 +1,98 @@
+from utils.bigquery.alter_target_table import alter_target_table
+from utils.bigquery.apply_target_table_partitioning import apply_target_table_partitioning
+from utils.bigquery.insert_target_table import insert_target_table
+from utils.bigquery.merge_target_table import merge_target_table
+from utils.bigquery.update_target_table import update_target_table
+from typing import (
+    List,
+    Optional,
+)
+
+def apply_temp_table_to_target_table(
+    target_project_id: str,
+    target_dataset_id: str,
+    target_table_id: str,
+    temp_project_id: str,
+    temp_dataset_id: str,
+    temp_table_id: str,
+    unique_column_name_list: List[str],
+    scd2_apply_mode: str = 'update_insert',
+    partition_column_name: Optional[str] = None,
+    partition_type: str = 'DAY',
+    cluster_column_name_list: Optional[List[str]] = None
+):
+    """
+    Arguments:
+    - target_project_id: Google Cloud project ID for target_table_id
+    - target_dataset_id: BigQuery dataset for target_table_id
+    - target_table_id: BigQuery target table name (must exist)
+    - temp_project_id: Google Cloud project ID for temp_table_id
+    - temp_dataset_id: BigQuery dataset for temp_table_id
+    - temp_table_id: BigQuery temp table name (loaded, external or streamed)
+    - unique_column_name_list: List of columns that define uniqueness
+    - scd2_apply_mode: How temp table changes are applied to the target table: update_insert (update_target_table then insert_target_table) or merge (single MERGE statement)
+    - partition_column_name: (optional) Target table partition column (e.g. audit_column__start_datetime_utc)
+    - partition_type: Target table partition granularity (HOUR, DAY, MONTH, YEAR)
+    - cluster_column_name_list: (optional) Target table cluster columns (e.g. unique columns and audit_column__active_flag)
+
+    Alters the target table to the temp table columns, partitions/clusters it (if spec changed) and applies the temp table records as SCD Type II changes.
+    """
+
+    # alter target table
+    alter_target_table(
+        target_project_id=target_project_id,
+        target_dataset_id=target_dataset_id,
+        target_table_id=target_table_id,
+        source_project_id=temp_project_id,
+        source_dataset_id=temp_dataset_id,
+        source_table_id=temp_table_id,
+        unique_column_name_list=unique_column_name_list
+    )
+
+    # partition/cluster target table (if spec changed)
+    if partition_column_name or cluster_column_name_list:
+        apply_target_table_partitioning(
+            project_id=target_project_id,
+            dataset_id=target_dataset_id,
+            table_id=target_table_id,
+            partition_column_name=partition_column_name,
+            partition_type=partition_type,
+            cluster_column_name_list=cluster_column_name_list
+        )
+
+    if scd2_apply_mode == 'merge':
+
+        # expire/insert updated records and insert new records (one job)
+        merge_target_table(
+            target_project_id=target_project_id,
+            target_dataset_id=target_dataset_id,
+            target_table_id=target_table_id,
+            source_project_id=temp_project_id,
+            source_dataset_id=temp_dataset_id,
+            source_table_id=temp_table_id,
+            unique_column_name_list=unique_column_name_list
+        )
+
+    else:
+
+        # update target table
+        update_target_table(
+            target_project_id=target_project_id,
+            target_dataset_id=target_dataset_id,
+            target_table_id=target_table_id,
+            source_project_id=temp_project_id,
+            source_dataset_id=temp_dataset_id,
+            source_table_id=temp_table_id,
+            unique_column_name_list=unique_column_name_list
+        )
+
+        # insert
+        insert_target_table(
+            target_project_id=target_project_id,
+            target_dataset_id=target_dataset_id,
+            target_table_id=target_table_id,
+            source_project_id=temp_project_id,
+            source_dataset_id=temp_dataset_id,
+            source_table_id=temp_table_id,
+            unique_column_name_list=unique_column_name_list
+        )
@@ -0,0 +1,67 @@
+from google.cloud import bigquery
+from typing import (
+    List,
+)
+import logging
+
+def create_external_table_with_cloud_storage(
+    cloudstorage_bucket_name: str,
+    cloudstorage_object_pattern: str,
+    bigquery_project_id: str,
+    bigquery_dataset_id: str,
+    bigquery_table_id: str,
+    bigquery_schema_field_list: List = [],
+    source_format: str = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+) -> None:
+
+    """
+    Arguments:
+    - cloudstorage_bucket_name: Cloud Storage bucket name
+    - cloudstorage_object_pattern: Cloud Storage object pattern (e.g. 'tmp/matches/20250722/*.json' or 'tmp/matches/20250722/*.json.gz' for gzip compressed objects)
+    - bigquery_project_id: BigQuery Project ID
+    - bigquery_dataset_id: BigQuery dataset ID
+    - bigquery_table_id: BigQuery table ID
+    - bigquery_schema_field_list: List of column SchemaField objects
+    - source_format: BigQuery source format (e.g. NEWLINE_DELIMITED_JSON, PARQUET)
+
+    Creates a BigQuery external table over all GCS files with a specific extension under a prefix.
+    No data is loaded or stored in BigQuery: queries read the files directly.
+    """
+
+    try:
+
+        # Construct a BigQuery client object.
+        client = bigquery.Client()
+
+        table_fq = f"{bigquery_project_id}.{bigquery_dataset_id}.{bigquery_table_id}"
+        cloudstorage_uri = f"gs://{cloudstorage_bucket_name}/{cloudstorage_object_pattern}"
+
+        # construct external data config
+        external_config = bigquery.ExternalConfig(source_format)
+        external_config.source_uris = [cloudstorage_uri]
+
+        # unlike load jobs, external tables do not detect gzip compression
+        if cloudstorage_object_pattern.endswith('.gz'):
+            external_config.compression = 'GZIP'
+
+        # read parquet lists as repeated fields (rather than a struct wrapping a repeated field)
+        if source_format == bigquery.SourceFormat.PARQUET:
+            parquet_options = bigquery.ParquetOptions()
+            parquet_options.enable_list_inference = True
+            external_config.parquet_options = parquet_options
+
+        # add schema/autodetect logic
+        table = bigquery.Table(table_fq)
+        if bigquery_schema_field_list == []:
+            external_config.autodetect = True
+        else:
+            table.schema = bigquery_schema_field_list
+        table.external_data_configuration = external_config
+
+        client.create_table(table)
+
+        logging.info(f"Created external Bigquery table ({table_fq}) over Cloud Storage URI ({cloudstorage_uri})")
+
+    except Exception as e:
+        logging.error(f"Error creating external Bigquery table ({table_fq}) over Cloud Storage URI ({cloudstorage_uri}): {e}.")
+        raise
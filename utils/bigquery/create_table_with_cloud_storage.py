@@ -12,16 +12,18 @@ def create_table_with_cloud_storage(
     bigquery_dataset_location: str,
     bigquery_table_id: str,
     bigquery_schema_field_list: List = [],
+    source_format: str = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
 ) -> None:
     
     """
     Arguments:
     - cloudstorage_bucket_name: Cloud Storage bucket name
-    - cloudstorage_object_pattern: Cloud Storage object pattern (e.g. 'tmp/matches/20250722/')
+    - cloudstorage_object_pattern: Cloud Storage object pattern (e.g. 'tmp/matches/20250722/*.json' or 'tmp/matches/20250722/*.json.gz' for gzip compressed objects)
     - bigquery_project_id: BigQuery Project ID
     - bigquery_dataset_id: BigQuery dataset ID
     - bigquery_table_id: BigQuery table ID
     - bigquery_schema_field_list: List of column SchemaField objects
+    - source_format: BigQuery source format (e.g. NEWLINE_DELIMITED_JSON, PARQUET)
 
 
     Loads all GCS files with a specific extension under a prefix into a BigQuery table.
@@ -37,10 +39,16 @@ def create_table_with_cloud_storage(
 
         # construct job config dict
         job_config_dict = {
-            "source_format": bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            "source_format": source_format,
             "write_disposition": "WRITE_APPEND",
         }
 
+        # load parquet lists as repeated fields (rather than a struct wrapping a repeated field)
+        if source_format == bigquery.SourceFormat.PARQUET:
+            parquet_options = bigquery.ParquetOptions()
+            parquet_options.enable_list_inference = True
+            job_config_dict['parquet_options'] = parquet_options
+
         # add schema/autodetect logic
         if bigquery_schema_field_list == []:
             job_config_dict['autodetect'] = True
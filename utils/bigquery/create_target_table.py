@@ -1,7 +1,12 @@
 
 from google.cloud import bigquery
+from utils.bigquery.apply_target_table_partitioning import apply_target_table_partitioning
 from utils.bigquery.create_table_with_df import create_table_with_df
 from utils.bigquery.create_table_with_cloud_storage import create_table_with_cloud_storage
+from typing import (
+    List,
+    Optional,
+)
 import logging
 import pandas as pd
 
@@ -33,7 +38,8 @@ def add_audit_columns(
             ADD COLUMN audit_column__end_datetime_utc TIMESTAMP,
             ADD COLUMN audit_column__insert_datetime_utc TIMESTAMP,
             ADD COLUMN audit_column__update_datetime_utc TIMESTAMP,
-            ADD COLUMN audit_column__delete_datetime_utc TIMESTAMP
+            ADD COLUMN audit_column__delete_datetime_utc TIMESTAMP,
+            ADD COLUMN audit_column__row_hash INT64
             ;
         """
         
@@ -105,7 +111,10 @@ def create_target_table_with_cloud_storage(
     bigquery_project_id: str,
     bigquery_dataset_id: str,
     bigquery_dataset_location: str,
-    bigquery_table_id: str
+    bigquery_table_id: str,
+    partition_column_name: Optional[str] = None,
+    partition_type: str = 'DAY',
+    cluster_column_name_list: Optional[List[str]] = None
 ) -> None:
     
     """
@@ -115,8 +124,11 @@ def create_target_table_with_cloud_storage(
         bigquery_project_id: BigQuery Project ID
         bigquery_dataset_id: BigQuery dataset ID
         bigquery_table_id: BigQuery table ID
+        partition_column_name: (optional) Partition column (e.g. audit_column__start_datetime_utc)
+        partition_type: Partition granularity (HOUR, DAY, MONTH, YEAR)
+        cluster_column_name_list: (optional) Cluster columns (e.g. unique columns and audit_column__active_flag)
 
-    Loads all GCS files with a specific extension under a prefix into a BigQuery `target` table and adds audit columns.
+    Loads all GCS files with a specific extension under a prefix into a BigQuery `target` table, adds audit columns and partitions/clusters it (if set).
     """
 
     try:
@@ -138,6 +150,16 @@ def create_target_table_with_cloud_storage(
             table_id=bigquery_table_id
         )
 
+        if partition_column_name or cluster_column_name_list:
+            apply_target_table_partitioning(
+                project_id=bigquery_project_id,
+                dataset_id=bigquery_dataset_id,
+                table_id=bigquery_table_id,
+                partition_column_name=partition_column_name,
+                partition_type=partition_type,
+                cluster_column_name_list=cluster_column_name_list
+            )
+
     except Exception as e:
         logging.error(f"Error during target table creation and/or audit column update: {e}.")
         raise
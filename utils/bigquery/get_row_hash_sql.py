@@ -0,0 +1,27 @@
+from typing import List
+
+def get_row_hash_sql(
+    column_name_list: List[str],
+    table_alias: str,
+    nested_column_name_list: List[str] = []
+) -> str:
+    """
+    Arguments:
+    - column_name_list: List of columns to fingerprint (non-unique columns)
+    - table_alias: Alias of the table the columns are selected from
+    - nested_column_name_list: List of ARRAY/STRUCT columns (serialized as json instead of cast to string)
+
+    Returns a SQL expression of the row content fingerprint (INT64): FARM_FINGERPRINT over the json of a struct of the columns.
+    Columns are sorted by name and scalar values are cast to string, so the fingerprint does not depend on column order or numeric data type,
+    and NULL values fingerprint differently than non-NULL values.
+    """
+
+    column_sql_list = [
+        f"{table_alias}.{column_name} AS {column_name}"
+        if column_name in nested_column_name_list
+        else f"SAFE_CAST({table_alias}.{column_name} AS STRING) AS {column_name}"
+        for column_name in sorted(column_name_list)
+    ]
+    column_sql_str = ',\n'.join(column_sql_list)
+
+    return f"FARM_FINGERPRINT(TO_JSON_STRING(STRUCT(\n{column_sql_str}\n)))"
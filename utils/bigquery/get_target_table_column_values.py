@@ -0,0 +1,44 @@
+from google.cloud import bigquery
+from typing import (
+    Set,
+)
+import logging
+
+def get_target_table_column_values(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    column_name: str
+) -> Set:
+    """
+    Arguments:
+    - project_id: Google Cloud project ID
+    - dataset_id: Dataset name
+    - table_id: Table name
+    - column_name: Column to select
+
+    Returns set of distinct column values for active records in target table.
+    """
+
+    try:
+
+        # Construct a BigQuery client object.
+        client = bigquery.Client()
+
+        column_values_sql = f"""
+            SELECT DISTINCT
+                {column_name}
+            FROM {project_id}.{dataset_id}.{table_id}
+            WHERE audit_column__active_flag = true
+            ;
+        """
+        logging.info(f"Getting distinct `{column_name}` values from `{project_id}.{dataset_id}.{table_id}`.")
+        column_values_sql_job = client.query(column_values_sql)
+        column_value_set = {row[0] for row in column_values_sql_job.result()}
+        logging.info(f"Found {len(column_value_set)} distinct `{column_name}` values.")
+
+        return column_value_set
+
+    except Exception as e:
+        logging.error(f"Error getting `{column_name}` values from `{project_id}.{dataset_id}.{table_id}`: {e}.")
+        raise
\ No newline at end of file
@@ -0,0 +1,64 @@
+from google.cloud import bigquery
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+import logging
+
+def get_target_table_record_hashes(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    unique_column_name_list: List[str],
+    hash_column_name: str
+) -> Dict[Tuple, str]:
+    """
+    Arguments:
+    - project_id: Google Cloud project ID
+    - dataset_id: Dataset name
+    - table_id: Table name
+    - unique_column_name_list: List of columns that define uniqueness
+    - hash_column_name: Column the record hash is stored in
+
+    Returns dict of unique column values (tuple of strings) to record hash for active records in target table.
+    Empty if the target table does not have the hash column yet.
+    """
+
+    try:
+
+        # Construct a BigQuery client object.
+        client = bigquery.Client()
+
+        # check hash column existence (table metadata, no query job)
+        table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
+        if hash_column_name not in [schema_field.name for schema_field in table.schema]:
+            logging.info(f"`{project_id}.{dataset_id}.{table_id}` has no `{hash_column_name}` column yet.")
+            return {}
+
+        unique_column_str = ',\n'.join(unique_column_name_list)
+        record_hashes_sql = f"""
+            SELECT
+                {unique_column_str},
+                {hash_column_name}
+            FROM {project_id}.{dataset_id}.{table_id}
+            WHERE 1=1
+                AND audit_column__active_flag = true
+                AND {hash_column_name} IS NOT NULL
+            ;
+        """
+        logging.info(f"Getting `{hash_column_name}` values from `{project_id}.{dataset_id}.{table_id}`.")
+        record_hashes_sql_job = client.query(record_hashes_sql)
+
+        # unique column values are compared as strings (staged values may be stringified)
+        record_hash_dict = {}
+        for row in record_hashes_sql_job.result():
+            row_value_list = list(row.values())
+            record_hash_dict[tuple(str(value) for value in row_value_list[:-1])] = row_value_list[-1]
+        logging.info(f"Found {len(record_hash_dict)} `{hash_column_name}` values.")
+
+        return record_hash_dict
+
+    except Exception as e:
+        logging.error(f"Error getting `{hash_column_name}` values from `{project_id}.{dataset_id}.{table_id}`: {e}.")
+        raise
@@ -1,4 +1,5 @@
 from google.cloud import bigquery
+from utils.bigquery.get_row_hash_sql import get_row_hash_sql
 from typing import List
 import logging
 
@@ -22,7 +23,7 @@ def insert_target_table(
     - unique_column_name_list: List of columns that define uniqueness
 
     Compare records between source table and target table.
-    Inserts records from source table that do not exist in the target table.
+    Inserts records from source table that do not exist in the target table (with their row content fingerprint, audit_column__row_hash).
     """
 
     try:
@@ -39,14 +40,16 @@ def insert_target_table(
         # get list of columns from source table (for use in UPDATE statements)
         source_column_sql = f"""
             SELECT
-                COLUMN_NAME
+                COLUMN_NAME,
+                DATA_TYPE
             FROM {source_project_id}.{source_dataset_id}.INFORMATION_SCHEMA.COLUMNS
             WHERE 1=1
                 AND TABLE_SCHEMA = '{source_dataset_id}'
                 AND TABLE_NAME = '{source_table_id}'
         """
         source_column_sql_job = client.query(source_column_sql)
-        source_column_list = [row[0] for row in source_column_sql_job.result()]
+        source_column_data_type_dict = {row[0]: row[1] for row in source_column_sql_job.result()}
+        source_column_list = list(source_column_data_type_dict)
 
         # generate lists/strings for unique/nonunique columns
         unique_column_join_str = ' AND '.join([
@@ -59,13 +62,23 @@ def insert_target_table(
                 f"{source_alias}.{col}" for col in source_column_list
             ]
         )
+        non_unique_column_name_list = list(filter(lambda col: col not in unique_column_name_list, source_column_list))
+        source_row_hash_sql = get_row_hash_sql(
+            column_name_list=non_unique_column_name_list,
+            table_alias=source_alias,
+            nested_column_name_list=[
+                col for col in non_unique_column_name_list
+                if source_column_data_type_dict[col].startswith(('ARRAY', 'STRUCT'))
+            ]
+        )
 
         # handle inserts for new records
         insert_new_sql = f"""
             INSERT INTO {target_project_id}.{target_dataset_id}.{target_table_id}
-            ({source_column_str}, audit_column__active_flag, audit_column__record_type, audit_column__start_datetime_utc, audit_column__insert_datetime_utc)
+            ({source_column_str}, audit_column__row_hash, audit_column__active_flag, audit_column__record_type, audit_column__start_datetime_utc, audit_column__insert_datetime_utc)
             SELECT
                 {source_column_str_w_source_alias},
+                {source_row_hash_sql} AS audit_column__row_hash,
                 true AS audit_column__active_flag,
                 'insert' AS audit_column__record_type,
                 current_timestamp AS audit_column__start_datetime_utc,
@@ -0,0 +1,168 @@
+from utils.bigquery.add_audit_columns import add_audit_columns
+from utils.bigquery.apply_temp_table_to_target_table import apply_temp_table_to_target_table
+from utils.bigquery.apply_target_table_partitioning import apply_target_table_partitioning
+from utils.bigquery.check_table_existence import check_table_existence
+from utils.bigquery.create_external_table_with_cloud_storage import create_external_table_with_cloud_storage
+from utils.bigquery.create_schema_field import create_schema_field
+from utils.bigquery.create_table_with_cloud_storage import create_table_with_cloud_storage
+from utils.bigquery.drop_table import drop_table
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+import logging
+
+def load_target_table_with_cloud_storage(
+    cloudstorage_bucket_name: str,
+    cloudstorage_object_pattern: str,
+    target_project_id: str,
+    target_dataset_id: str,
+    target_dataset_location: str,
+    target_table_id: str,
+    temp_project_id: str,
+    temp_dataset_id: str,
+    temp_dataset_location: str,
+    temp_table_id: str,
+    unique_column_name_list: List[str],
+    column_metadata_list: List[Dict],
+    source_format: str = 'NEWLINE_DELIMITED_JSON',
+    scd2_apply_mode: str = 'update_insert',
+    temp_table_type: str = 'load',
+    partition_column_name: Optional[str] = None,
+    partition_type: str = 'DAY',
+    cluster_column_name_list: Optional[List[str]] = None
+):
+    """
+    Arguments:
+    - cloudstorage_bucket_name: Cloud Storage bucket name
+    - cloudstorage_object_pattern: Cloud Storage object pattern (e.g. 'web/tennisabstract/matches/20250722/*.json')
+    - target_project_id: Google Cloud project ID for target_table_id
+    - target_dataset_id: BigQuery dataset for target_table_id
+    - target_dataset_location: BigQuery dataset location for target_table_id
+    - target_table_id: BigQuery target table name
+    - temp_project_id: Google Cloud project ID for temp_table_id
+    - temp_dataset_id: BigQuery dataset for temp_table_id
+    - temp_dataset_location: BigQuery dataset location for temp_table_id
+    - temp_table_id: BigQuery temp table name
+    - unique_column_name_list: List of columns that define uniqueness
+    - column_metadata_list: List of column metadata (column_name, python_data_type, bigquery_data_type); empty to use the schema of the objects (ex. parquet)
+    - source_format: BigQuery source format of the objects (e.g. NEWLINE_DELIMITED_JSON, PARQUET)
+    - scd2_apply_mode: How temp table changes are applied to the target table: update_insert (update_target_table then insert_target_table) or merge (single MERGE statement)
+    - temp_table_type: How the temp table is created: load (load job into a native table) or external (external table over the objects, nothing loaded)
+    - partition_column_name: (optional) Target table partition column (e.g. audit_column__start_datetime_utc)
+    - partition_type: Target table partition granularity (HOUR, DAY, MONTH, YEAR)
+    - cluster_column_name_list: (optional) Target table cluster columns (e.g. unique columns and audit_column__active_flag)
+
+    Loads Cloud Storage objects into the target table.
+    If the target table exists, objects are loaded to the temp table which is then used to alter/update/insert the target table.
+    Otherwise the target table is created from the objects (with audit columns).
+    The target table is partitioned/clustered (if set) at creation, or migrated before the temp table is applied.
+    """
+
+    # convert column metadata to bigquery schema field
+    schema_field_list = []
+    for column_metadata_dict in column_metadata_list:
+        # initialize/construct bigquery SchemaField
+        schema_field_dict = {}
+        schema_field_dict['name'] = column_metadata_dict['column_name']
+        schema_field_dict['field_type'] = column_metadata_dict['bigquery_data_type']
+
+        # append to list
+        schema_field_bigquery_object = create_schema_field(
+            schema_field_dict=schema_field_dict
+        )
+        schema_field_list.append(schema_field_bigquery_object)
+
+    logging.info(f"BigQuery column SchemaField list: {schema_field_list}.")
+
+    # check target table existence
+    target_table_exists_flag = check_table_existence(
+        project_id=target_project_id,
+        dataset_id=target_dataset_id,
+        table_id=target_table_id
+    )
+
+    if target_table_exists_flag == True:
+
+        # drop temp table
+        drop_table(
+            project_id=temp_project_id,
+            dataset_id=temp_dataset_id,
+            table_id=temp_table_id
+        )
+
+        # create temp table (external tables read the objects directly, no load job)
+        if temp_table_type == 'external':
+            create_external_table_with_cloud_storage(
+                cloudstorage_bucket_name=cloudstorage_bucket_name,
+                cloudstorage_object_pattern=cloudstorage_object_pattern,
+                bigquery_project_id=temp_project_id,
+                bigquery_dataset_id=temp_dataset_id,
+                bigquery_table_id=temp_table_id,
+                bigquery_schema_field_list=schema_field_list,
+                source_format=source_format
+            )
+        else:
+            create_table_with_cloud_storage(
+                cloudstorage_bucket_name=cloudstorage_bucket_name,
+                cloudstorage_object_pattern=cloudstorage_object_pattern,
+                bigquery_project_id=temp_project_id,
+                bigquery_dataset_id=temp_dataset_id,
+                bigquery_dataset_location=temp_dataset_location,
+                bigquery_table_id=temp_table_id,
+                bigquery_schema_field_list=schema_field_list,
+                source_format=source_format
+            )
+
+        # apply temp table to target table (alter, partition/cluster, SCD Type II)
+        apply_temp_table_to_target_table(
+            target_project_id=target_project_id,
+            target_dataset_id=target_dataset_id,
+            target_table_id=target_table_id,
+            temp_project_id=temp_project_id,
+            temp_dataset_id=temp_dataset_id,
+            temp_table_id=temp_table_id,
+            unique_column_name_list=unique_column_name_list,
+            scd2_apply_mode=scd2_apply_mode,
+            partition_column_name=partition_column_name,
+            partition_type=partition_type,
+            cluster_column_name_list=cluster_column_name_list
+        )
+
+        # drop temp table
+        drop_table(
+            project_id=temp_project_id,
+            dataset_id=temp_dataset_id,
+            table_id=temp_table_id
+        )
+
+    else:
+        # otherwise create/load target table
+        create_table_with_cloud_storage(
+            cloudstorage_bucket_name=cloudstorage_bucket_name,
+            cloudstorage_object_pattern=cloudstorage_object_pattern,
+            bigquery_project_id=target_project_id,
+            bigquery_dataset_id=target_dataset_id,
+            bigquery_dataset_location=target_dataset_location,
+            bigquery_table_id=target_table_id,
+            bigquery_schema_field_list=schema_field_list,
+            source_format=source_format
+        )
+        # add audit columns
+        add_audit_columns(
+            project_id=target_project_id,
+            dataset_id=target_dataset_id,
+            table_id=target_table_id
+        )
+
+        # partition/cluster target table
+        if partition_column_name or cluster_column_name_list:
+            apply_target_table_partitioning(
+                project_id=target_project_id,
+                dataset_id=target_dataset_id,
+                table_id=target_table_id,
+                partition_column_name=partition_column_name,
+                partition_type=partition_type,
+                cluster_column_name_list=cluster_column_name_list
+            )
\ No newline at end of file
@@ -0,0 +1,133 @@
+from google.cloud import bigquery
+from utils.bigquery.add_audit_columns import add_audit_columns
+from utils.bigquery.apply_target_table_partitioning import apply_target_table_partitioning
+from utils.bigquery.apply_temp_table_to_target_table import apply_temp_table_to_target_table
+from utils.bigquery.check_table_existence import check_table_existence
+from utils.bigquery.drop_table import drop_table
+from utils.bigquery.write_records_with_storage_write_api import write_records_with_storage_write_api
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+import logging
+
+def load_target_table_with_storage_write_api(
+    record_list: List[Dict],
+    target_project_id: str,
+    target_dataset_id: str,
+    target_table_id: str,
+    temp_project_id: str,
+    temp_dataset_id: str,
+    temp_table_id: str,
+    unique_column_name_list: List[str],
+    scd2_apply_mode: str = 'update_insert',
+    partition_column_name: Optional[str] = None,
+    partition_type: str = 'DAY',
+    cluster_column_name_list: Optional[List[str]] = None
+):
+    """
+    Arguments:
+    - record_list: List (of dictionaries) of records to load (values are loaded as STRING columns)
+    - target_project_id: Google Cloud project ID for target_table_id
+    - target_dataset_id: BigQuery dataset for target_table_id
+    - target_table_id: BigQuery target table name
+    - temp_project_id: Google Cloud project ID for temp_table_id
+    - temp_dataset_id: BigQuery dataset for temp_table_id
+    - temp_table_id: BigQuery temp table name
+    - unique_column_name_list: List of columns that define uniqueness
+    - scd2_apply_mode: How temp table changes are applied to the target table: update_insert (update_target_table then insert_target_table) or merge (single MERGE statement)
+    - partition_column_name: (optional) Target table partition column (e.g. audit_column__start_datetime_utc)
+    - partition_type: Target table partition granularity (HOUR, DAY, MONTH, YEAR)
+    - cluster_column_name_list: (optional) Target table cluster columns (e.g. unique columns and audit_column__active_flag)
+
+    Loads records into the target table with the BigQuery Storage Write API (no Cloud Storage objects or load job).
+    If the target table exists, records are streamed to the temp table which is then used to alter/update/insert the target table.
+    Otherwise the target table is created and records are streamed to it (with audit columns).
+    """
+
+    # columns in first seen order (records may not all have every column)
+    column_name_list = list(dict.fromkeys(column_name for record in record_list for column_name in record))
+    schema_field_list = [bigquery.SchemaField(column_name, 'STRING') for column_name in column_name_list]
+
+    # initialize client
+    client = bigquery.Client()
+
+    # check target table existence
+    target_table_exists_flag = check_table_existence(
+        project_id=target_project_id,
+        dataset_id=target_dataset_id,
+        table_id=target_table_id
+    )
+
+    if target_table_exists_flag == True:
+
+        # drop/create temp table
+        drop_table(
+            project_id=temp_project_id,
+            dataset_id=temp_dataset_id,
+            table_id=temp_table_id
+        )
+        client.create_table(bigquery.Table(f"{temp_project_id}.{temp_dataset_id}.{temp_table_id}", schema=schema_field_list))
+
+        # stream records to temp table (committed atomically)
+        write_records_with_storage_write_api(
+            record_list=record_list,
+            column_name_list=column_name_list,
+            project_id=temp_project_id,
+            dataset_id=temp_dataset_id,
+            table_id=temp_table_id
+        )
+
+        # apply temp table to target table (alter, partition/cluster, SCD Type II)
+        apply_temp_table_to_target_table(
+            target_project_id=target_project_id,
+            target_dataset_id=target_dataset_id,
+            target_table_id=target_table_id,
+            temp_project_id=temp_project_id,
+            temp_dataset_id=temp_dataset_id,
+            temp_table_id=temp_table_id,
+            unique_column_name_list=unique_column_name_list,
+            scd2_apply_mode=scd2_apply_mode,
+            partition_column_name=partition_column_name,
+            partition_type=partition_type,
+            cluster_column_name_list=cluster_column_name_list
+        )
+
+        # drop temp table
+        drop_table(
+            project_id=temp_project_id,
+            dataset_id=temp_dataset_id,
+            table_id=temp_table_id
+        )
+
+    else:
+        # otherwise create target table and stream records to it
+        client.create_table(bigquery.Table(f"{target_project_id}.{target_dataset_id}.{target_table_id}", schema=schema_field_list))
+        write_records_with_storage_write_api(
+            record_list=record_list,
+            column_name_list=column_name_list,
+            project_id=target_project_id,
+            dataset_id=target_dataset_id,
+            table_id=target_table_id
+        )
+
+        # add audit columns
+        add_audit_columns(
+            project_id=target_project_id,
+            dataset_id=target_dataset_id,
+            table_id=target_table_id
+        )
+
+        # partition/cluster target table
+        if partition_column_name or cluster_column_name_list:
+            apply_target_table_partitioning(
+                project_id=target_project_id,
+                dataset_id=target_dataset_id,
+                table_id=target_table_id,
+                partition_column_name=partition_column_name,
+                partition_type=partition_type,
+                cluster_column_name_list=cluster_column_name_list
+            )
+
+    logging.info(f"Loaded {len(record_list)} records into `{target_project_id}.{target_dataset_id}.{target_table_id}` with the Storage Write API.")
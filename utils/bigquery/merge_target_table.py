@@ -0,0 +1,173 @@
+from google.cloud import bigquery
+from utils.bigquery.get_row_hash_sql import get_row_hash_sql
+from typing import List
+import logging
+
+def merge_target_table(
+    target_project_id: str,
+    target_dataset_id: str,
+    target_table_id: str,
+    source_project_id: str,
+    source_dataset_id: str,
+    source_table_id: str,
+    unique_column_name_list: List[str]
+):
+    """
+    Arguments:
+    - target_project_id: Google Cloud project ID for target_table_id
+    - target_dataset_id: BigQuery dataset for target_table_id
+    - target_table_id: BigQuery target table name
+    - source_project_id: Google Cloud project ID for source_table_id
+    - source_dataset_id: BigQuery dataset for source_table_id
+    - source_table_id: BigQuery source table name
+    - unique_column_name_list: List of columns that define uniqueness
+
+    Applies SCD Type II changes from source table to target table in a single MERGE statement:
+    - expire the current target table record if there is an updated version in the source table (and insert the updated version)
+    - insert source table records that do not exist in the target table
+    Records are compared on the row content fingerprint (audit_column__row_hash).
+    Same result as update_target_table followed by insert_target_table, in one job (no INFORMATION_SCHEMA query or intermediate update table).
+    """
+
+    try:
+
+        logging.info(f"Running SCD Type II merge on `{target_project_id}.{target_dataset_id}.{target_table_id}`.")
+
+        # initialize client
+        client = bigquery.Client()
+
+        # create alias variables (for use in SQL statements)
+        target_alias = 'TGT'
+        source_alias = 'SRC'
+        merge_alias = 'MRG'
+
+        # get list of columns from source table (table metadata, no query job)
+        source_table = client.get_table(f"{source_project_id}.{source_dataset_id}.{source_table_id}")
+        source_column_list = [schema_field.name for schema_field in source_table.schema]
+        source_nested_column_set = {
+            schema_field.name for schema_field in source_table.schema
+            if schema_field.mode == 'REPEATED' or schema_field.field_type in ('RECORD', 'STRUCT')
+        }
+
+        # generate lists/strings for unique/nonunique columns
+        merge_key_column_list = [f"merge_key__{unique_column_name}" for unique_column_name in unique_column_name_list]
+        source_column_str = ',\n'.join(source_column_list)
+        source_column_str_w_source_alias = ',\n'.join(
+            [
+                f"{source_alias}.{col}" for col in source_column_list
+            ]
+        )
+        source_column_str_w_merge_alias = ',\n'.join(
+            [
+                f"{merge_alias}.{col}" for col in source_column_list
+            ]
+        )
+        unique_column_join_str = ' AND '.join([
+            f"{target_alias}.{unique_column_name} = {source_alias}.{unique_column_name}"
+            for unique_column_name in unique_column_name_list
+        ])
+        merge_key_join_str = ' AND '.join([
+            f"{target_alias}.{unique_column_name} = {merge_alias}.{merge_key_column}"
+            for unique_column_name, merge_key_column in zip(unique_column_name_list, merge_key_column_list)
+        ])
+        merge_key_str = ',\n'.join([
+            f"{source_alias}.{unique_column_name} AS {merge_key_column}"
+            for unique_column_name, merge_key_column in zip(unique_column_name_list, merge_key_column_list)
+        ])
+        unique_column_str_w_source_alias = ', '.join([
+            f"{source_alias}.{unique_column_name}" for unique_column_name in unique_column_name_list
+        ])
+        merge_key_null_str = ',\n'.join([
+            f"NULL AS {merge_key_column}"
+            for merge_key_column in merge_key_column_list
+        ])
+
+        # row content fingerprints (nested columns, ex. parquet staged ARRAY/STRUCT, are serialized as json)
+        non_unique_column_name_list = list(filter(lambda col: col not in unique_column_name_list, source_column_list))
+        nested_column_name_list = [col for col in non_unique_column_name_list if col in source_nested_column_set]
+        source_row_hash_sql = get_row_hash_sql(
+            column_name_list=non_unique_column_name_list,
+            table_alias=source_alias,
+            nested_column_name_list=nested_column_name_list
+        )
+        target_row_hash_sql = get_row_hash_sql(
+            column_name_list=non_unique_column_name_list,
+            table_alias=target_alias,
+            nested_column_name_list=nested_column_name_list
+        )
+
+        # the persisted target fingerprint is only comparable if it was computed over the same columns as the source
+        # (otherwise, or if not yet populated, it is computed from the target columns)
+        target_table = client.get_table(f"{target_project_id}.{target_dataset_id}.{target_table_id}")
+        target_non_unique_column_name_set = {
+            schema_field.name for schema_field in target_table.schema
+            if not schema_field.name.startswith('audit_column__') and schema_field.name not in unique_column_name_list
+        }
+        row_hash_backfill_flag = target_non_unique_column_name_set == set(non_unique_column_name_list)
+        if row_hash_backfill_flag:
+            target_row_hash_sql = f"COALESCE({target_alias}.audit_column__row_hash, {target_row_hash_sql})"
+
+        # active records without a persisted fingerprint (ex. loaded before the fingerprint column existed) are backfilled
+        row_hash_backfill_clause = f"""
+            WHEN MATCHED
+                AND {target_alias}.audit_column__active_flag = true
+                AND {target_alias}.audit_column__row_hash IS NULL
+            THEN UPDATE SET
+                audit_column__row_hash = {merge_alias}.merge_row_hash""" if row_hash_backfill_flag else ''
+
+        # source rows are merged twice:
+        # - on their unique columns (one row per key, a MERGE fails if a target row matches several source rows):
+        #   expires the active target record if changed, inserts the record if the key is new
+        # - with null merge keys (changed records only): never match, so the updated version is inserted
+        merge_sql = f"""
+            MERGE {target_project_id}.{target_dataset_id}.{target_table_id} AS {target_alias}
+            USING (
+                SELECT
+                    {source_column_str_w_source_alias},
+                    {merge_key_str},
+                    {source_row_hash_sql} AS merge_row_hash,
+                    'insert' AS merge_record_type
+                FROM {source_project_id}.{source_dataset_id}.{source_table_id} AS {source_alias}
+                WHERE 1=1
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY {unique_column_str_w_source_alias} ORDER BY {source_row_hash_sql}) = 1
+
+                UNION ALL
+
+                SELECT
+                    {source_column_str_w_source_alias},
+                    {merge_key_null_str},
+                    {source_row_hash_sql} AS merge_row_hash,
+                    'update' AS merge_record_type
+                FROM {source_project_id}.{source_dataset_id}.{source_table_id} AS {source_alias}
+                INNER JOIN {target_project_id}.{target_dataset_id}.{target_table_id} AS {target_alias} ON {unique_column_join_str}
+                WHERE 1=1
+                    AND {target_alias}.audit_column__active_flag = true
+                    AND {source_row_hash_sql} != {target_row_hash_sql}
+            ) AS {merge_alias}
+            ON {merge_key_join_str}
+            WHEN MATCHED
+                AND {target_alias}.audit_column__active_flag = true
+                AND {merge_alias}.merge_row_hash != {target_row_hash_sql}
+            THEN UPDATE SET
+                audit_column__active_flag = false,
+                audit_column__end_datetime_utc = current_timestamp,
+                audit_column__update_datetime_utc = current_timestamp{row_hash_backfill_clause}
+            WHEN NOT MATCHED THEN INSERT
+            ({source_column_str}, audit_column__row_hash, audit_column__active_flag, audit_column__record_type, audit_column__start_datetime_utc, audit_column__insert_datetime_utc)
+            VALUES (
+                {source_column_str_w_merge_alias},
+                {merge_alias}.merge_row_hash,
+                true,
+                {merge_alias}.merge_record_type,
+                current_timestamp,
+                current_timestamp
+            )
+            ;
+        """
+        merge_sql_job = client.query(merge_sql)
+        merge_sql_job.result()
+        logging.info(f"SCD merge completed successfully ({merge_sql_job.num_dml_affected_rows} rows affected).")
+
+    except Exception as e:
+        logging.error(f"Failed to merge target table `{target_project_id}.{target_dataset_id}.{target_table_id}`: {e}")
+        raise
\ No newline at end of file
@@ -1,5 +1,6 @@
 from google.cloud import bigquery
 from utils.bigquery.drop_table import drop_table
+from utils.bigquery.get_row_hash_sql import get_row_hash_sql
 from typing import List
 import logging
 
@@ -22,7 +23,7 @@ def update_target_table(
     - source_table_id: BigQuery source table name
     - unique_column_name_list: List of columns that define uniqueness
 
-    Compare records between source table and target table.
+    Compare records between source table and target table (on the row content fingerprint, audit_column__row_hash).
     For a given record in the target table, if there is an updated version of that record in the source table:
     - expire the current target table record
     - insert the updated source table record as a new record in the target table
@@ -42,14 +43,16 @@ def update_target_table(
         # get list of columns from source table (for use in UPDATE statements)
         source_column_sql = f"""
             SELECT
-                COLUMN_NAME
+                COLUMN_NAME,
+                DATA_TYPE
             FROM {source_project_id}.{source_dataset_id}.INFORMATION_SCHEMA.COLUMNS
             WHERE 1=1
                 AND TABLE_SCHEMA = '{source_dataset_id}'
                 AND TABLE_NAME = '{source_table_id}'
         """
         source_column_sql_job = client.query(source_column_sql)
-        source_column_list = [row[0] for row in source_column_sql_job.result()]
+        source_column_data_type_dict = {row[0]: row[1] for row in source_column_sql_job.result()}
+        source_column_list = list(source_column_data_type_dict)
 
         # generate lists/strings for unique/nonunique columns
         source_column_str = ',\n'.join(source_column_list)
@@ -62,13 +65,35 @@ def update_target_table(
             f"{target_alias}.{unique_column_name} = {source_alias}.{unique_column_name}"
             for unique_column_name in unique_column_name_list
         ])
-        non_unique_column_name_list = list(filter(lambda col: col not in unique_column_name_list, source_column_list))       
-        non_unique_column_where_clause = '(' + '\nOR '.join(
-            [
-                f"SAFE_CAST({source_alias}.{col} AS STRING) != SAFE_CAST({target_alias}.{col} AS STRING)"
-                for col in non_unique_column_name_list
-            ]
-        ) + ')'
+        non_unique_column_name_list = list(filter(lambda col: col not in unique_column_name_list, source_column_list))
+        unique_column_str = ',\n'.join(unique_column_name_list)
+
+        # row content fingerprints (nested columns, ex. parquet staged ARRAY/STRUCT, are serialized as json)
+        nested_column_name_list = [
+            col for col in non_unique_column_name_list
+            if source_column_data_type_dict[col].startswith(('ARRAY', 'STRUCT'))
+        ]
+        source_row_hash_sql = get_row_hash_sql(
+            column_name_list=non_unique_column_name_list,
+            table_alias=source_alias,
+            nested_column_name_list=nested_column_name_list
+        )
+        target_row_hash_sql = get_row_hash_sql(
+            column_name_list=non_unique_column_name_list,
+            table_alias=target_alias,
+            nested_column_name_list=nested_column_name_list
+        )
+
+        # the persisted target fingerprint is only comparable if it was computed over the same columns as the source
+        # (otherwise, or if not yet populated, it is computed from the target columns)
+        target_table = client.get_table(f"{target_project_id}.{target_dataset_id}.{target_table_id}")
+        target_non_unique_column_name_set = {
+            schema_field.name for schema_field in target_table.schema
+            if not schema_field.name.startswith('audit_column__') and schema_field.name not in unique_column_name_list
+        }
+        if target_non_unique_column_name_set == set(non_unique_column_name_list):
+            target_row_hash_sql = f"COALESCE({target_alias}.audit_column__row_hash, {target_row_hash_sql})"
+
         update_unique_column_where_clause = ' AND '.join([
             f"{target_alias}.{unique_column_name} = {compare_alias}.{unique_column_name}"
             for unique_column_name in unique_column_name_list
@@ -86,28 +111,30 @@ def update_target_table(
         create_update_table_sql = f"""
             CREATE TABLE IF NOT EXISTS {update_project_id}.{update_dataset_id}.{update_table_id} AS
                 WITH
-                    -- select target table columns
+                    -- select target table unique columns and fingerprint
                     -- select active records
-                    -- EXCLUDE audit columns
                     {target_alias} AS (
                         SELECT
-                            {source_column_str}
-                        FROM {target_project_id}.{target_dataset_id}.{target_table_id}
+                            {unique_column_str},
+                            {target_row_hash_sql} AS audit_column__row_hash
+                        FROM {target_project_id}.{target_dataset_id}.{target_table_id} AS {target_alias}
                         WHERE audit_column__active_flag = true
                     ),
                     -- select source table columns
                     {source_alias} AS (
                         SELECT
-                            {source_column_str}
-                        FROM {source_project_id}.{source_dataset_id}.{source_table_id}
+                            {source_column_str},
+                            {source_row_hash_sql} AS audit_column__row_hash
+                        FROM {source_project_id}.{source_dataset_id}.{source_table_id} AS {source_alias}
                     ),
-                    -- join source and target rows
+                    -- join source and target rows (on unique columns) and compare fingerprints
                     JOINED AS (
                         SELECT
-                            {source_column_str_w_source_alias}
+                            {source_column_str_w_source_alias},
+                            {source_alias}.audit_column__row_hash
                         FROM {target_alias}
                         INNER JOIN {source_alias} ON {unique_column_join_str}
-                        WHERE {non_unique_column_where_clause}
+                        WHERE {source_alias}.audit_column__row_hash != {target_alias}.audit_column__row_hash
                     )
                 SELECT * FROM JOINED
             ;
@@ -136,9 +163,10 @@ def update_target_table(
         # handle updates for new records
         update_new_sql = f"""
             INSERT INTO {target_project_id}.{target_dataset_id}.{target_table_id}
-            ({source_column_str}, audit_column__active_flag, audit_column__record_type, audit_column__start_datetime_utc, audit_column__insert_datetime_utc)
+            ({source_column_str}, audit_column__row_hash, audit_column__active_flag, audit_column__record_type, audit_column__start_datetime_utc, audit_column__insert_datetime_utc)
             SELECT
                 {source_column_str},
+                audit_column__row_hash,
                 true AS audit_column__active_flag,
                 'update' AS audit_column__record_type,
                 current_timestamp AS audit_column__start_datetime_utc,
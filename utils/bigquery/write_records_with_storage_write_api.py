@@ -0,0 +1,146 @@
+from google.api_core.exceptions import (
+    InvalidArgument,
+    NotFound,
+)
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import (
+    types,
+    writer,
+)
+from google.protobuf import (
+    descriptor_pb2,
+    descriptor_pool,
+    message_factory,
+)
+from typing import (
+    Dict,
+    List,
+)
+from utils.web.get_backoff_delay import get_backoff_delay
+import logging
+import time
+
+def write_records_with_storage_write_api(
+    record_list: List[Dict],
+    column_name_list: List[str],
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    request_size_bytes: int = 5 * 1024 * 1024,
+    retries: int = 5,
+    delay: int = 2
+) -> int:
+    """
+    Arguments:
+    - record_list: List (of dictionaries) of records to write (values are written as strings)
+    - column_name_list: List of columns to write (STRING columns of the table; missing/None values are written as NULL)
+    - project_id: Google Cloud project ID
+    - dataset_id: Dataset name
+    - table_id: Table name (must exist)
+    - request_size_bytes: Approximate serialized size of each append request (the API limit is 10 MB)
+    - retries: Number of attempts to create the stream and send the first append (ex. table created moments ago)
+    - delay: Base time (in seconds) between retries (grows exponentially with jitter)
+
+    Streams records into table with the BigQuery Storage Write API (pending stream).
+    Rows are only visible after all appends succeed and the stream is committed (atomically, all or nothing).
+    Returns number of rows written.
+    """
+
+    if not record_list:
+        return 0
+
+    try:
+
+        write_client = bigquery_storage_v1.BigQueryWriteClient()
+        parent = write_client.table_path(project_id, dataset_id, table_id)
+
+        # build a (proto2) message of string fields for the columns
+        descriptor_proto = descriptor_pb2.DescriptorProto(name='Record')
+        for field_number, column_name in enumerate(column_name_list, start=1):
+            descriptor_proto.field.add(
+                name=column_name,
+                number=field_number,
+                type=descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+            )
+        pool = descriptor_pool.DescriptorPool()
+        pool.Add(descriptor_pb2.FileDescriptorProto(name='record.proto', message_type=[descriptor_proto]))
+        record_message_class = message_factory.GetMessageClass(pool.FindMessageTypeByName('Record'))
+
+        # serialize rows into requests of about request_size_bytes (offsets make retried appends idempotent)
+        append_rows_request_list = []
+        row_offset = 0
+        proto_rows = types.ProtoRows()
+        proto_rows_size_bytes = 0
+        for record_index, record in enumerate(record_list):
+            serialized_row = record_message_class(**{
+                column_name: str(record[column_name])
+                for column_name in column_name_list
+                if record.get(column_name) is not None
+            }).SerializeToString()
+            proto_rows.serialized_rows.append(serialized_row)
+            proto_rows_size_bytes += len(serialized_row)
+
+            if proto_rows_size_bytes >= request_size_bytes or record_index == len(record_list) - 1:
+                append_rows_request = types.AppendRowsRequest(offset=row_offset)
+                append_rows_request.proto_rows = types.AppendRowsRequest.ProtoData(rows=proto_rows)
+                append_rows_request_list.append(append_rows_request)
+                row_offset += len(proto_rows.serialized_rows)
+                proto_rows = types.ProtoRows()
+                proto_rows_size_bytes = 0
+
+        # create pending stream and send the first append
+        # a newly created table can return NOT_FOUND (or a schema mismatch) for a few seconds, so retry with backoff
+        attempt = 0
+        while True:
+            try:
+                write_stream = write_client.create_write_stream(
+                    parent=parent,
+                    write_stream=types.WriteStream(type_=types.WriteStream.Type.PENDING)
+                )
+
+                # the writer schema is sent with the first request of the connection
+                request_template = types.AppendRowsRequest(write_stream=write_stream.name)
+                request_template.proto_rows = types.AppendRowsRequest.ProtoData(
+                    writer_schema=types.ProtoSchema(proto_descriptor=descriptor_proto)
+                )
+                append_rows_stream = writer.AppendRowsStream(write_client, request_template)
+                append_rows_stream.send(append_rows_request_list[0]).result()
+                break
+
+            except (InvalidArgument, NotFound) as e:
+                attempt += 1
+                if attempt >= retries:
+                    logging.error(f"Max retries reached creating write stream for `{project_id}.{dataset_id}.{table_id}`.")
+                    raise
+                backoff_delay = get_backoff_delay(attempt=attempt, base_delay_seconds=delay)
+                logging.warning(f"Attempt {attempt} to create write stream failed ({e}) - retrying in {backoff_delay:.1f} seconds...")
+                time.sleep(backoff_delay)
+
+        # append remaining rows and wait (raises on error, nothing is committed)
+        append_future_list = [
+            append_rows_stream.send(append_rows_request)
+            for append_rows_request in append_rows_request_list[1:]
+        ]
+        for append_future in append_future_list:
+            append_future.result()
+        append_rows_stream.close()
+
+        # finalize and commit stream
+        write_client.finalize_write_stream(name=write_stream.name)
+        commit_response = write_client.batch_commit_write_streams(
+            types.BatchCommitWriteStreamsRequest(
+                parent=parent,
+                write_streams=[write_stream.name]
+            )
+        )
+        if commit_response.stream_errors:
+            raise RuntimeError(f"Stream commit errors: {list(commit_response.stream_errors)}")
+
+        logging.info(f"Wrote {row_offset} rows to `{project_id}.{dataset_id}.{table_id}` (committed at {commit_response.commit_time}).")
+
+        return row_offset
+
+    except Exception as e:
+        logging.error(f"Error writing records to `{project_id}.{dataset_id}.{table_id}` with the Storage Write API: {e}.")
+        raise
@@ -0,0 +1,16 @@
+from typing import Dict
+import os
+
+def get_cloud_run_task_properties() -> Dict:
+    """
+    See docs for more information: https://cloud.google.com/run/docs/container-contract#jobs-env-vars
+
+    Returns the task index, task count and execution name of the running Cloud Run job task.
+    Defaults to a single task when run outside of a Cloud Run job.
+    """
+
+    return {
+        'task_index': int(os.environ.get('CLOUD_RUN_TASK_INDEX', 0)),
+        'task_count': int(os.environ.get('CLOUD_RUN_TASK_COUNT', 1)),
+        'execution_name': os.environ.get('CLOUD_RUN_EXECUTION', 'local'),
+    }
\ No newline at end of file
@@ -0,0 +1,5 @@
+cloud_storage_upload_default_config = {
+    "chunk_size_bytes": 8 * 1024 * 1024,  # resumable upload chunk size (must be a multiple of 256 KiB)
+    "df_chunk_row_count": 1000,  # dataframe rows serialized at a time
+    "gzip_flag": False,  # gzip object contents while streaming
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+def get_cloud_storage_object_extension(
+    file_format: str = 'json',
+    gzip_flag: bool = False
+) -> str:
+    """
+    Arguments:
+    - file_format: Object file format (json or parquet)
+    - gzip_flag: Objects are gzip compressed (json only; parquet is compressed internally)
+
+    Returns the object extension (also used to build the object pattern BigQuery loads from).
+    """
+
+    if file_format == 'parquet':
+        return '.parquet'
+
+    return '.json.gz' if gzip_flag else '.json'
\ No newline at end of file
@@ -0,0 +1,42 @@
+from google.api_core.exceptions import NotFound
+from google.cloud import storage
+from typing import (
+    Any,
+    Optional,
+)
+from utils.python.deserialize_json import deserialize_json
+import logging
+
+def read_json_from_cloud_storage(
+    bucket_name: str,
+    object_path: str
+) -> Optional[Any]:
+    """
+    Arguments:
+    - bucket_name: Cloud Storage bucket name
+    - object_path: Full object path (e.g. 'web/tennisabstract/url_manifest/20250722/url_manifest.json')
+
+    Returns parsed JSON object or None if the object does not exist.
+    """
+
+    try:
+
+        # initialize client
+        client = storage.Client()
+
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(object_path)
+
+        data = deserialize_json(data=blob.download_as_bytes())
+
+        logging.info(f"Read data from gs://{bucket_name}/{object_path}")
+
+        return data
+
+    except NotFound:
+        logging.info(f"Object gs://{bucket_name}/{object_path} does not exist.")
+        return None
+
+    except Exception as e:
+        logging.error(f"Error when reading data from gs://{bucket_name}/{object_path}: {e}.")
+        raise
\ No newline at end of file
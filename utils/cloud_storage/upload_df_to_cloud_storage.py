@@ -1,20 +1,29 @@
+from contextlib import nullcontext
 from google.cloud import storage
 from pandas import DataFrame
+from utils.cloud_storage.cloud_storage_upload_default_config import cloud_storage_upload_default_config
+import gzip
 import logging
 
 def upload_df_to_cloud_storage(
     df: DataFrame,
     bucket_name: str,
-    object_path: str
+    object_path: str,
+    chunk_size_bytes: int = cloud_storage_upload_default_config['chunk_size_bytes'],
+    df_chunk_row_count: int = cloud_storage_upload_default_config['df_chunk_row_count'],
+    gzip_flag: bool = cloud_storage_upload_default_config['gzip_flag']
 ) -> None:
     """
     Arguments:
     - df: Pandas dataframe to upload
     - bucket_name: Cloud Storage bucket name
     - object_path: Full object path (e.g. 'tmp/matches/20250722/matches_batch_000001.json')
-    - file_extension
+    - chunk_size_bytes: Resumable upload chunk size (must be a multiple of 256 KiB)
+    - df_chunk_row_count: Number of dataframe rows serialized at a time
+    - gzip_flag: Gzip object contents
 
     Uploads dataframe to Cloud Storage in NDJSON format.
+    Rows are serialized in chunks into a resumable upload, so the full NDJSON string is never built in memory.
     """
     try:
 
@@ -24,10 +33,22 @@ def upload_df_to_cloud_storage(
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(object_path)
 
-        data = df.to_json(orient="records", lines=True)
-        blob.upload_from_string(data, content_type="application/json")
+        with blob.open(
+            'wb',
+            chunk_size=chunk_size_bytes,
+            ignore_flush=True,
+            content_type='application/gzip' if gzip_flag else 'application/json'
+        ) as blob_file:
+            with (gzip.GzipFile(fileobj=blob_file, mode='wb') if gzip_flag else nullcontext(blob_file)) as object_file:
+                for i in range(0, len(df), df_chunk_row_count):
+                    data = df.iloc[i:i + df_chunk_row_count].to_json(orient="records", lines=True)
+                    # keep lines separated across chunks
+                    if not data.endswith('\n'):
+                        data += '\n'
+                    object_file.write(data.encode('utf-8'))
 
         logging.info(f"Uploaded data to gs://{bucket_name}/{object_path}")
 
     except Exception as e:
-        logging.error(f"Error when uploading data to gs://{bucket_name}/{object_path}: {e}.")
\ No newline at end of file
+        logging.error(f"Error when uploading data to gs://{bucket_name}/{object_path}: {e}.")
+        raise
\ No newline at end of file
@@ -1,23 +1,31 @@
+from contextlib import nullcontext
 from google.cloud import storage
 from typing import (
     Dict,
     List,
 )
-import json
+from utils.cloud_storage.cloud_storage_upload_default_config import cloud_storage_upload_default_config
+from utils.python.serialize_json import serialize_json
+import gzip
 import logging
 
 def write_batch_to_cloud_storage(
     record_list: List[Dict],
     bucket_name: str,
-    object_path: str
+    object_path: str,
+    chunk_size_bytes: int = cloud_storage_upload_default_config['chunk_size_bytes'],
+    gzip_flag: bool = cloud_storage_upload_default_config['gzip_flag']
 ):
     """
     Arguments:
     - record_list: List (of dictionaries) of records to write.
     - bucket_name: Cloud Storage bucket name
     - object_path
+    - chunk_size_bytes: Resumable upload chunk size (must be a multiple of 256 KiB)
+    - gzip_flag: Gzip object contents
 
     Write record list to Cloud Storage.
+    Records are encoded one at a time into a resumable upload, so memory peaks at one upload chunk rather than the whole batch.
     """
 
     try:
@@ -26,9 +34,18 @@ def write_batch_to_cloud_storage(
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(object_path)
 
-        # NDJSON string
-        lines = [json.dumps(record) for record in record_list]
-        blob.upload_from_string('\n'.join(lines), content_type='application/json')
+        # NDJSON stream
+        with blob.open(
+            'wb',
+            chunk_size=chunk_size_bytes,
+            ignore_flush=True,
+            content_type='application/gzip' if gzip_flag else 'application/json'
+        ) as blob_file:
+            with (gzip.GzipFile(fileobj=blob_file, mode='wb') if gzip_flag else nullcontext(blob_file)) as object_file:
+                for index, record in enumerate(record_list):
+                    if index > 0:
+                        object_file.write(b'\n')
+                    object_file.write(serialize_json(data=record))
 
         logging.info(f"Wrote data to bucket {bucket_name} object path {object_path}.")
 
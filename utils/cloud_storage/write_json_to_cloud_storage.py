@@ -0,0 +1,50 @@
+from google.api_core.exceptions import PreconditionFailed
+from google.cloud import storage
+from typing import (
+    Any,
+    Optional,
+)
+from utils.python.serialize_json import serialize_json
+import logging
+
+def write_json_to_cloud_storage(
+    data: Any,
+    bucket_name: str,
+    object_path: str,
+    if_generation_match: Optional[int] = None
+) -> bool:
+    """
+    Arguments:
+    - data: JSON-serializable object to write
+    - bucket_name: Cloud Storage bucket name
+    - object_path: Full object path
+    - if_generation_match: (optional) Generation precondition (0 only writes if the object does not exist yet)
+
+    Writes object to Cloud Storage as JSON. Returns False if the generation precondition was not met.
+    """
+
+    try:
+
+        # initialize client
+        client = storage.Client()
+
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(object_path)
+
+        blob.upload_from_string(
+            serialize_json(data=data),
+            content_type='application/json',
+            if_generation_match=if_generation_match
+        )
+
+        logging.info(f"Wrote data to gs://{bucket_name}/{object_path}")
+
+        return True
+
+    except PreconditionFailed:
+        logging.info(f"Object gs://{bucket_name}/{object_path} was not written (generation precondition not met).")
+        return False
+
+    except Exception as e:
+        logging.error(f"Error when writing data to gs://{bucket_name}/{object_path}: {e}.")
+        raise
\ No newline at end of file
@@ -0,0 +1,66 @@
+from google.cloud import storage
+from typing import (
+    Dict,
+    List,
+)
+from utils.cloud_storage.cloud_storage_upload_default_config import cloud_storage_upload_default_config
+from utils.python.convert_value_to_arrow_type import convert_value_to_arrow_type
+import logging
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+def write_parquet_to_cloud_storage(
+    record_list: List[Dict],
+    schema: pa.Schema,
+    bucket_name: str,
+    object_path: str,
+    chunk_size_bytes: int = cloud_storage_upload_default_config['chunk_size_bytes'],
+    compression: str = 'snappy'
+):
+    """
+    Arguments:
+    - record_list: List (of dictionaries) of records to write
+    - schema: Arrow schema of the records (columns not in the schema are dropped, values are converted to the field types)
+    - bucket_name: Cloud Storage bucket name
+    - object_path: Full object path (e.g. 'tmp/matches/20250722/matches_batch_000001.parquet')
+    - chunk_size_bytes: Resumable upload chunk size (must be a multiple of 256 KiB)
+    - compression: Parquet compression codec
+
+    Write record list to Cloud Storage as a typed Parquet file (streamed into a resumable upload).
+    """
+
+    try:
+
+        # log columns that are not part of the schema
+        extra_column_set = set().union(*record_list) - set(schema.names)
+        if extra_column_set:
+            logging.warning(f"Columns not in schema are dropped: {sorted(extra_column_set)}.")
+
+        # convert values to the schema (ex. numbers in string fields, numeric/date strings in typed fields; unparseable values become null)
+        record_list = [
+            {
+                field.name: convert_value_to_arrow_type(value=record.get(field.name), data_type=field.type)
+                for field in schema
+            }
+            for record in record_list
+        ]
+
+        table = pa.Table.from_pylist(record_list, schema=schema)
+
+        client = storage.Client()
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(object_path)
+
+        with blob.open(
+            'wb',
+            chunk_size=chunk_size_bytes,
+            ignore_flush=True,
+            content_type='application/vnd.apache.parquet'
+        ) as blob_file:
+            pq.write_table(table, blob_file, compression=compression)
+
+        logging.info(f"Wrote data to bucket {bucket_name} object path {object_path}.")
+
+    except Exception as e:
+        logging.error(f"Error when writing to bucket {bucket_name} object path {object_path}: {e}.")
+        raise
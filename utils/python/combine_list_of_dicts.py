@@ -1,26 +1,49 @@
 from typing import (
     Dict,
     List,
+    Optional,
 )
-import json
+from utils.python.serialize_json import serialize_json
+import hashlib
 
-def combine_list_of_dicts(*lists) -> List[Dict]:
+def combine_list_of_dicts(
+    *lists,
+    key_list: Optional[List[str]] = None
+) -> List[Dict]:
     """
     Arguments:
     - *lists: any number of lists of objects
+    - key_list: (optional) Keys fingerprinted to find candidate duplicates (ex. ['date', 'tourn', 'round', 'opp'] for matchmx); defaults to all keys
 
-    Returns a deduped/combined list of objects.
+    Returns a deduped/combined list of objects (first occurrence kept, in order).
+    Each object is reduced to a fingerprint and only compared (exactly) against kept objects with the same fingerprint.
+    With key_list, the fingerprint is the tuple of those values (no serialization of the object);
+    otherwise it is a 64-bit hash of the whole object serialized.
     """
 
-    combined = []
-    for lst in lists:
-        combined.extend(lst)
-    
-    seen = set()
+    # fingerprint: kept objects with that fingerprint (usually one)
+    seen = {}
     unique_dicts = []
-    for d in combined:
-        dict_str = json.dumps(d, sort_keys=True)
-        if dict_str not in seen:
-            seen.add(dict_str)
-            unique_dicts.append(d)
+    for lst in lists:
+        for d in lst:
+
+            if key_list is None:
+                fingerprint = hashlib.blake2b(serialize_json(data=d, sort_keys=True, default=str), digest_size=8).digest()
+            else:
+                fingerprint = tuple(d.get(key) for key in key_list)
+
+            # unhashable key values (ex. lists) fall back to a hash of the serialized values
+            try:
+                kept_dict_list = seen.get(fingerprint)
+            except TypeError:
+                fingerprint = hashlib.blake2b(serialize_json(data=list(fingerprint), default=str), digest_size=8).digest()
+                kept_dict_list = seen.get(fingerprint)
+
+            if kept_dict_list is None:
+                seen[fingerprint] = [d]
+                unique_dicts.append(d)
+            elif all(kept_dict != d for kept_dict in kept_dict_list):
+                kept_dict_list.append(d)
+                unique_dicts.append(d)
+
     return unique_dicts
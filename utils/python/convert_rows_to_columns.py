@@ -0,0 +1,41 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+import logging
+
+def convert_rows_to_columns(
+    row_iterable: Iterable[List],
+    header_index_dict: Dict[str, int],
+    row_length: Optional[int] = None
+) -> Dict[str, List]:
+    """
+    Arguments:
+    - row_iterable: Iterable of rows (as lists)
+    - header_index_dict: Dictionary of header: row element index
+    - row_length: (optional) Expected row length; rows of any other length are skipped
+
+    Returns dictionary of header: list of column values (columnar layout), built in one pass over the rows.
+    """
+
+    column_dict = {header: [] for header in header_index_dict}
+
+    # bind appends once instead of looking them up per value
+    column_append_list = [
+        (column_dict[header].append, elem_index)
+        for header, elem_index in header_index_dict.items()
+    ]
+
+    for row in row_iterable:
+
+        # skip if incomplete
+        if row_length is not None and len(row) != row_length:
+            logging.info(f"Header count ({row_length}) does not match value count ({len(row)}).")
+            continue
+
+        for column_append, elem_index in column_append_list:
+            column_append(row[elem_index])
+
+    return column_dict
\ No newline at end of file
@@ -0,0 +1,96 @@
+from datetime import (
+    date,
+    datetime,
+)
+from typing import Any
+import pyarrow as pa
+
+# date formats parsed into date fields (ex. 20250722 from urls/javascript variables, July 22, 2025 from tournament pages)
+date_format_list = [
+    '%Y%m%d',
+    '%Y-%m-%d',
+    '%B %d, %Y',
+    '%b %d, %Y',
+]
+
+# strings parsed into boolean fields
+boolean_string_dict = {
+    'true': True,
+    'false': False,
+    '1': True,
+    '0': False,
+}
+
+def convert_value_to_arrow_type(
+    value: Any,
+    data_type: pa.DataType
+) -> Any:
+    """
+    Arguments:
+    - value: Value to convert (scalar, list or dictionary)
+    - data_type: Arrow data type of the value
+
+    Returns value converted to the Arrow data type (recursing into lists and structs):
+    - string fields: non-string scalars converted with str() (ex. numbers parsed from javascript arrays)
+    - integer, floating point, boolean and date fields: parsed from strings/numbers (quotes and whitespace stripped)
+    Values that cannot be parsed (ex. '' or 'NA' in a numeric field) are returned as None. Other values are returned as is.
+    """
+
+    if value is None:
+        return None
+
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return value if isinstance(value, str) else str(value)
+
+    if (pa.types.is_list(data_type) or pa.types.is_large_list(data_type)) and isinstance(value, list):
+        return [convert_value_to_arrow_type(value=elem, data_type=data_type.value_type) for elem in value]
+
+    if pa.types.is_struct(data_type) and isinstance(value, dict):
+        return {
+            field.name: convert_value_to_arrow_type(value=value.get(field.name), data_type=field.type)
+            for field in data_type
+        }
+
+    # scalars read from pages are often (quoted) strings
+    value_str = value.strip().strip('\'"').strip() if isinstance(value, str) else None
+
+    if pa.types.is_boolean(data_type):
+        if isinstance(value, bool):
+            return value
+        return boolean_string_dict.get(str(value).lower() if value_str is None else value_str.lower())
+
+    if pa.types.is_integer(data_type):
+        if isinstance(value, bool):
+            return None
+        try:
+            return int(value if value_str is None else value_str)
+        except (TypeError, ValueError):
+            pass
+        # integral floats (ex. 3.0 or '3.0')
+        try:
+            value_float = float(value if value_str is None else value_str)
+        except (TypeError, ValueError):
+            return None
+        return int(value_float) if value_float.is_integer() else None
+
+    if pa.types.is_floating(data_type):
+        if isinstance(value, bool):
+            return None
+        try:
+            return float(value if value_str is None else value_str)
+        except (TypeError, ValueError):
+            return None
+
+    if pa.types.is_date(data_type):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        for date_format in date_format_list:
+            try:
+                return datetime.strptime(str(value) if value_str is None else value_str, date_format).date()
+            except ValueError:
+                continue
+        return None
+
+    return value
@@ -0,0 +1,27 @@
+from typing import (
+    Any,
+    Union,
+)
+import json
+
+# use orjson (C extension) when installed, otherwise stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def deserialize_json(
+    data: Union[str, bytes]
+) -> Any:
+    """
+    Arguments:
+    - data: JSON document (string or UTF-8 encoded bytes)
+
+    Returns parsed JSON object, decoded with orjson when installed (stdlib json otherwise).
+    Raises ValueError (json.JSONDecodeError) on invalid JSON either way.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from typing import (
+    Dict,
+    List,
+)
+from utils.python.serialize_json import serialize_json
+import hashlib
+
+# column the record hash is stored in (target tables loaded with unchanged records skipped)
+record_hash_column_name = 'source_record_hash'
+
+def get_record_hash(
+    record: Dict,
+    exclude_column_name_list: List[str] = []
+) -> str:
+    """
+    Arguments:
+    - record: Record (dictionary) to hash
+    - exclude_column_name_list: Columns left out of the hash (ex. volatile values that change on every scrape)
+
+    Returns a stable 64-bit hash (16 hex characters) of the record: blake2b over its json with sorted keys.
+    The record hash column itself is never part of the hash.
+    """
+
+    record_hash_dict = {
+        column_name: value
+        for column_name, value in record.items()
+        if column_name not in exclude_column_name_list and column_name != record_hash_column_name
+    }
+
+    return hashlib.blake2b(
+        serialize_json(data=record_hash_dict, sort_keys=True, default=str),
+        digest_size=8
+    ).hexdigest()
@@ -0,0 +1,39 @@
+from typing import (
+    Dict,
+    List,
+)
+import logging
+
+def merge_column_metadata(
+    column_metadata_dict: Dict[str, Dict],
+    column_metadata_list: List[Dict]
+) -> Dict[str, Dict]:
+    """
+    Arguments:
+    - column_metadata_dict: Dictionary of column name: column metadata seen so far (updated in place)
+    - column_metadata_list: List of column metadata (column_name, python_data_type, bigquery_data_type) to merge in
+
+    Merges column metadata (ex. from another batch or task) into the dictionary.
+    Columns with inconsistent data types are cast to string.
+    """
+
+    for column_metadata in column_metadata_list:
+
+        col = column_metadata['column_name']
+        python_data_type = column_metadata['python_data_type']
+
+        # check if columns does not exist in metadata
+        if col not in column_metadata_dict:
+            column_metadata_dict[col] = dict(column_metadata)
+
+        # otherwise, check the datatypes of columns already seen
+        else:
+            python_data_type_existing = column_metadata_dict[col]['python_data_type']
+
+            # if data type mismatch, cast to string
+            if python_data_type_existing != python_data_type:
+                logging.warning(f"Column {col} has inconsistent data type across batches: existing ({python_data_type_existing}) versus new ({python_data_type}) --> casting to string.")
+                column_metadata_dict[col]['python_data_type'] = 'string'
+                column_metadata_dict[col]['bigquery_data_type'] = 'STRING'
+
+    return column_metadata_dict
\ No newline at end of file
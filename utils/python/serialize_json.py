@@ -0,0 +1,45 @@
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+import json
+
+# use orjson (C extension) when installed, otherwise stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def serialize_json(
+    data: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable] = None
+) -> bytes:
+    """
+    Arguments:
+    - data: JSON-serializable object
+    - sort_keys: Sort dictionary keys (ex. for a canonical form to dedupe or hash on)
+    - default: (optional) Function called for objects that are not natively serializable (ex. str)
+
+    Returns compact UTF-8 encoded JSON.
+    Encodes with orjson when installed, falling back to stdlib json (also for values orjson rejects, ex. non string keys, integers over 64 bits).
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                option=orjson.OPT_SORT_KEYS if sort_keys else None
+            )
+        except TypeError:
+            pass
+
+    return json.dumps(
+        data,
+        sort_keys=sort_keys,
+        default=default,
+        separators=(',', ':'),
+        ensure_ascii=False
+    ).encode('utf-8')
\ No newline at end of file
@@ -0,0 +1,109 @@
+from utils.web.request_rate_limit_default_config import request_rate_limit_default_config
+import logging
+import threading
+import time
+
+# token buckets shared by every worker in the process (keyed by host)
+host_bucket_dict = {}
+host_bucket_lock = threading.Lock()
+
+def get_host_bucket(
+    host: str
+) -> dict:
+    """
+    Arguments:
+    - host: Request host (ex. www.tennisabstract.com)
+
+    Returns the token bucket for the host (created on first use). Caller must hold host_bucket_lock.
+    """
+
+    if host not in host_bucket_dict:
+        host_bucket_dict[host] = {
+            'tokens': float(request_rate_limit_default_config['burst']),
+            'requests_per_second': float(request_rate_limit_default_config['requests_per_second']),
+            'updated_at': time.monotonic(),
+            'blocked_until': 0.0,
+        }
+
+    return host_bucket_dict[host]
+
+def acquire_request_token(
+    host: str
+) -> None:
+    """
+    Arguments:
+    - host: Request host
+
+    Blocks until a request token is available for the host (and any throttle window set for the host has passed).
+    """
+
+    burst = request_rate_limit_default_config['burst']
+
+    while True:
+
+        with host_bucket_lock:
+
+            bucket = get_host_bucket(host=host)
+
+            # refill tokens for the time elapsed since the last update
+            now = time.monotonic()
+            bucket['tokens'] = min(burst, bucket['tokens'] + max(0.0, now - bucket['updated_at']) * bucket['requests_per_second'])
+            bucket['updated_at'] = max(now, bucket['updated_at'])
+
+            if now < bucket['blocked_until']:
+                wait_seconds = bucket['blocked_until'] - now
+            elif bucket['tokens'] >= 1:
+                bucket['tokens'] -= 1
+                return
+            else:
+                wait_seconds = (1 - bucket['tokens']) / bucket['requests_per_second']
+
+        time.sleep(wait_seconds)
+
+def throttle_request_host(
+    host: str,
+    delay_seconds: float
+) -> None:
+    """
+    Arguments:
+    - host: Request host
+    - delay_seconds: Time (in seconds) during which no worker may send a request to the host
+
+    Pauses all requests to the host and halves its request rate (used when the host signals throttling).
+    """
+
+    with host_bucket_lock:
+
+        bucket = get_host_bucket(host=host)
+
+        bucket['blocked_until'] = max(bucket['blocked_until'], time.monotonic() + delay_seconds)
+        bucket['tokens'] = 0.0
+        bucket['updated_at'] = bucket['blocked_until'] # tokens only refill once the throttle window has passed
+        bucket['requests_per_second'] = max(
+            request_rate_limit_default_config['min_requests_per_second'],
+            bucket['requests_per_second'] / 2
+        )
+
+        logging.warning(f"Throttling requests to {host} for {delay_seconds:.1f} seconds (rate: {bucket['requests_per_second']:.2f} requests/second).")
+
+def recover_request_host(
+    host: str
+) -> None:
+    """
+    Arguments:
+    - host: Request host
+
+    Gradually restores the host request rate after a successful request.
+    """
+
+    requests_per_second_max = request_rate_limit_default_config['requests_per_second']
+
+    with host_bucket_lock:
+
+        bucket = get_host_bucket(host=host)
+
+        if bucket['requests_per_second'] < requests_per_second_max:
+            bucket['requests_per_second'] = min(
+                requests_per_second_max,
+                bucket['requests_per_second'] + requests_per_second_max / 10
+            )
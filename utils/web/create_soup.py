@@ -0,0 +1,29 @@
+from bs4 import (
+    BeautifulSoup,
+    FeatureNotFound,
+)
+from typing import Optional
+from utils.web.html_parser_config import html_parser_config
+import logging
+
+def create_soup(
+    html: str,
+    backend: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    Arguments:
+    - html: HTML string (ex. response text)
+    - backend: (optional) BeautifulSoup tree builder; defaults to the configured backend
+
+    Returns BeautifulSoup object built with the selected backend (html.parser by default, C-accelerated lxml opt-in).
+    Falls back to the pure python html.parser when the backend is not installed, so the query helpers (find, find_all) are the same either way.
+    """
+
+    backend = backend or html_parser_config['backend']
+
+    try:
+        return BeautifulSoup(html, backend)
+    except FeatureNotFound:
+        logging.warning(f"HTML parser backend {backend} not installed - falling back to {html_parser_config['fallback_backend']}.")
+        html_parser_config['backend'] = html_parser_config['fallback_backend']
+        return BeautifulSoup(html, html_parser_config['fallback_backend'])
\ No newline at end of file
@@ -0,0 +1,20 @@
+from utils.web.request_rate_limit_default_config import request_rate_limit_default_config
+import random
+
+def get_backoff_delay(
+    attempt: int,
+    base_delay_seconds: float = request_rate_limit_default_config['backoff_base_seconds'],
+    max_delay_seconds: float = request_rate_limit_default_config['backoff_max_seconds']
+) -> float:
+    """
+    Arguments:
+    - attempt: Number of attempts made so far (starting at 1)
+    - base_delay_seconds: Delay (in seconds) for the first retry
+    - max_delay_seconds: Max delay (in seconds)
+
+    Returns an exponential backoff delay with jitter (between half and all of base * 2^(attempt - 1)).
+    """
+
+    delay_seconds = min(max_delay_seconds, base_delay_seconds * 2 ** max(0, attempt - 1))
+
+    return delay_seconds / 2 + random.uniform(0, delay_seconds / 2)
@@ -0,0 +1,158 @@
+from google.api_core.exceptions import NotFound
+from google.cloud import storage
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from typing import (
+    Dict,
+    Optional,
+)
+from utils.python.deserialize_json import deserialize_json
+from utils.python.serialize_json import serialize_json
+from utils.web.response_cache_config import response_cache_config
+import hashlib
+import logging
+import os
+import threading
+import time
+
+# storage client reused across cache reads/writes (created on first use)
+storage_client = None
+storage_client_lock = threading.Lock()
+
+def get_response_cache_object_path(
+    url: str
+) -> Optional[str]:
+    """
+    Arguments:
+    - url: Request url
+
+    Returns the cache object path (local path or gs:// uri) for the url, or None if the cache is disabled.
+    """
+
+    cache_uri = response_cache_config['cache_uri']
+    if not cache_uri:
+        return None
+
+    # objects are keyed by the url hash
+    url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    return f"{cache_uri.rstrip('/')}/{url_hash[:2]}/{url_hash}.json"
+
+def get_storage_blob(
+    object_path: str
+):
+    """
+    Arguments:
+    - object_path: gs:// uri
+
+    Returns Cloud Storage blob for the uri.
+    """
+
+    global storage_client
+
+    with storage_client_lock:
+        if storage_client is None:
+            storage_client = storage.Client()
+
+    bucket_name, object_name = object_path.removeprefix('gs://').split('/', 1)
+
+    return storage_client.bucket(bucket_name).blob(object_name)
+
+def get_cached_response(
+    url: str
+) -> Optional[Dict]:
+    """
+    Arguments:
+    - url: Request url
+
+    Returns cached response dictionary (url, status code, headers, body, fetch time) or None if not cached.
+    """
+
+    object_path = get_response_cache_object_path(url=url)
+    if object_path is None:
+        return None
+
+    try:
+
+        if object_path.startswith('gs://'):
+            cached_response_str = get_storage_blob(object_path=object_path).download_as_text()
+        else:
+            with open(object_path, 'r', encoding='utf-8') as f:
+                cached_response_str = f.read()
+
+        return deserialize_json(data=cached_response_str)
+
+    except (FileNotFoundError, NotFound):
+        return None
+
+    except Exception as e:
+        logging.warning(f"Error reading cached response for {url}: {e}.")
+        return None
+
+def put_cached_response(
+    url: str,
+    response: Response
+) -> None:
+    """
+    Arguments:
+    - url: Request url
+    - response: Response to cache
+
+    Caches response (body, validator headers and fetch time) if it can be revalidated (has ETag or Last-Modified).
+    """
+
+    object_path = get_response_cache_object_path(url=url)
+    if object_path is None:
+        return
+
+    # only responses with validators can be revalidated later
+    header_dict = {
+        header: response.headers[header]
+        for header in ['ETag', 'Last-Modified', 'Content-Type']
+        if header in response.headers
+    }
+    if 'ETag' not in header_dict and 'Last-Modified' not in header_dict:
+        return
+
+    cached_response_dict = {
+        'url': url,
+        'status_code': response.status_code,
+        'headers': header_dict,
+        'body': response.text,
+        'fetched_at': time.time(),
+    }
+    cached_response_bytes = serialize_json(data=cached_response_dict)
+
+    try:
+
+        if object_path.startswith('gs://'):
+            get_storage_blob(object_path=object_path).upload_from_string(cached_response_bytes, content_type='application/json')
+        else:
+            # write to a temp file first so readers never see a partial object
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            object_path_tmp = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(object_path_tmp, 'wb') as f:
+                f.write(cached_response_bytes)
+            os.replace(object_path_tmp, object_path)
+
+    except Exception as e:
+        logging.warning(f"Error caching response for {url}: {e}.")
+
+def create_cached_response(
+    cached_response_dict: Dict
+) -> Response:
+    """
+    Arguments:
+    - cached_response_dict: Cached response dictionary (from get_cached_response)
+
+    Returns a requests Response built from the cached response.
+    """
+
+    response = Response()
+    response.status_code = cached_response_dict['status_code']
+    response.headers = CaseInsensitiveDict(cached_response_dict['headers'])
+    response.url = cached_response_dict['url']
+    response.encoding = 'utf-8'
+    response._content = cached_response_dict['body'].encode('utf-8')
+
+    return response
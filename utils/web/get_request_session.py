@@ -0,0 +1,49 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from utils.web.request_session_default_config import request_session_default_config
+import logging
+import threading
+
+# process-wide session (created on first use)
+request_session = None
+request_session_lock = threading.Lock()
+
+def get_request_session(
+    pool_connections: int = request_session_default_config['pool_connections'],
+    pool_maxsize: int = request_session_default_config['pool_maxsize']
+) -> Session:
+    """
+    Arguments:
+    - pool_connections: Number of per-host connection pools kept by the session
+    - pool_maxsize: Number of keep-alive connections kept per host
+
+    Returns the process-wide requests session so that connections (and TLS handshakes) are reused across requests.
+    Pool sizes only apply when the session is first created.
+    """
+
+    global request_session
+
+    with request_session_lock:
+
+        if request_session is None:
+
+            logging.info(f"Creating request session (pool connections: {pool_connections}, pool max size: {pool_maxsize}).")
+
+            # mount a pooled adapter for both schemes
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize
+            )
+            session = Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+            # advertise every content encoding urllib3 can decode (gzip/deflate, plus br when brotli is installed)
+            session.headers.update({
+                "Accept-Encoding": ACCEPT_ENCODING,
+            })
+
+            request_session = session
+
+    return request_session
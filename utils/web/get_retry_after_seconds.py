@@ -0,0 +1,34 @@
+from datetime import (
+    datetime,
+    timezone,
+)
+from email.utils import parsedate_to_datetime
+from typing import (
+    Optional,
+)
+
+def get_retry_after_seconds(
+    retry_after: Optional[str]
+) -> Optional[float]:
+    """
+    Arguments:
+    - retry_after: Retry-After header value (either delay seconds or an HTTP date)
+
+    Returns the number of seconds to wait or None if the header is missing/invalid.
+    """
+
+    if not retry_after:
+        return None
+
+    retry_after = retry_after.strip()
+
+    # delay seconds
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    # http date
+    try:
+        retry_after_datetime = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_after_datetime - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
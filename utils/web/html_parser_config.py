@@ -0,0 +1,10 @@
+import os
+
+html_parser_config = {
+    # BeautifulSoup tree builder (ex. html.parser, lxml, html5lib)
+    # lxml is opt-in (WEB_HTML_PARSER_BACKEND=lxml): it fixes up malformed HTML differently, so only switch once
+    # scripts/web/tennisabstract/check_html_parser_parity.py passes on saved pages of every entity
+    # selectolax is not supported yet (different query API; would need its own parse functions and a parity run)
+    "backend": os.environ.get("WEB_HTML_PARSER_BACKEND", "html.parser"),
+    "fallback_backend": "html.parser",  # used when the configured backend is not installed
+}
\ No newline at end of file
@@ -1,12 +1,43 @@
+from requests.exceptions import (
+    ConnectionError,
+    Timeout,
+)
+from typing import (
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlparse
+from utils.web.acquire_request_token import (
+    acquire_request_token,
+    recover_request_host,
+    throttle_request_host,
+)
+from utils.web.get_backoff_delay import get_backoff_delay
+from utils.web.get_cached_response import (
+    create_cached_response,
+    get_cached_response,
+    put_cached_response,
+)
+from utils.web.get_request_session import get_request_session
+from utils.web.get_retry_after_seconds import get_retry_after_seconds
+from utils.web.request_rate_limit_default_config import request_rate_limit_default_config
+from utils.web.request_session_default_config import request_session_default_config
+import logging
 import random
-import requests
+import time
 
 def make_request(
-    url: str
+    url: str,
+    timeout: Optional[Tuple[float, float]] = None,
+    retries: int = request_rate_limit_default_config['retries'],
+    use_cache: bool = False
 ):
     """
     Arguments:
     - url: Url for request
+    - timeout: (optional) Tuple of (connect, read) timeouts in seconds
+    - retries: Number of retries on connection errors/timeouts and retryable status codes
+    - use_cache: Revalidate against (and store into) the response cache (see utils.web.response_cache_config)
     Returns a response
     """
 
@@ -39,7 +70,70 @@ def make_request(
         "Connection": "keep-alive",
     }
 
-    # make request
-    response = requests.get(url, headers=headers)
+    # set connect/read timeouts so a stalled socket cannot hang the run
+    if timeout is None:
+        timeout = (
+            request_session_default_config['connect_timeout_seconds'],
+            request_session_default_config['read_timeout_seconds'],
+        )
 
-    return response
\ No newline at end of file
+    # send conditional request if a cached copy exists
+    cached_response_dict = get_cached_response(url=url) if use_cache else None
+    if cached_response_dict is not None:
+        cached_header_dict = cached_response_dict['headers']
+        if 'ETag' in cached_header_dict:
+            headers['If-None-Match'] = cached_header_dict['ETag']
+        if 'Last-Modified' in cached_header_dict:
+            headers['If-Modified-Since'] = cached_header_dict['Last-Modified']
+
+    session = get_request_session()
+    host = urlparse(url).netloc
+    attempt = 0
+
+    while True:
+
+        # wait for the shared per-host rate limiter
+        acquire_request_token(host=host)
+
+        # make request (using pooled keep-alive session)
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (ConnectionError, Timeout) as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+            backoff_delay = get_backoff_delay(attempt=attempt)
+            logging.warning(f"Request attempt {attempt} failed for {url}: {e}. Retrying in {backoff_delay:.1f} seconds...")
+            time.sleep(backoff_delay)
+            continue
+
+        # retry transient status codes (honoring Retry-After)
+        if response.status_code in request_rate_limit_default_config['retry_status_code_list'] and attempt < retries:
+            attempt += 1
+            retry_after_seconds = get_retry_after_seconds(retry_after=response.headers.get('Retry-After'))
+            backoff_delay = min(
+                request_rate_limit_default_config['backoff_max_seconds'],
+                max(retry_after_seconds or 0, get_backoff_delay(attempt=attempt))
+            )
+            logging.warning(f"Request attempt {attempt} for {url} returned status {response.status_code}. Retrying in {backoff_delay:.1f} seconds...")
+
+            # throttling responses slow down every worker for the host; otherwise only this request waits
+            if response.status_code in request_rate_limit_default_config['throttle_status_code_list']:
+                throttle_request_host(host=host, delay_seconds=backoff_delay)
+            else:
+                time.sleep(backoff_delay)
+            continue
+
+        if response.ok:
+            recover_request_host(host=host)
+
+        # serve unchanged page from cache
+        if response.status_code == 304 and cached_response_dict is not None:
+            logging.info(f"Page not modified, serving cached response for {url}.")
+            return create_cached_response(cached_response_dict=cached_response_dict)
+
+        # cache new/modified page
+        if use_cache and response.status_code == 200:
+            put_cached_response(url=url, response=response)
+
+        return response
\ No newline at end of file
@@ -0,0 +1,184 @@
+from typing import (
+    Any,
+    Iterator,
+)
+from utils.python.deserialize_json import deserialize_json
+import re
+
+# tokens of a javascript array literal (whitespace between tokens is skipped)
+javascript_array_token_pattern = re.compile(
+    r"""\s*(?:
+        (?P<open>\[)
+        | (?P<close>\])
+        | (?P<comma>,)
+        | '(?P<single_quoted>(?:[^'\\\n]|\\.)*)'
+        | "(?P<double_quoted>(?:[^"\\\n]|\\.)*)"
+        | (?P<bare>[^\s,\[\]'"]+)
+    )""",
+    re.VERBOSE | re.DOTALL
+)
+
+# escape sequences within quoted strings
+javascript_string_escape_pattern = re.compile(r"\\(x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|[0-7]{1,3}|\n|.)", re.DOTALL)
+javascript_string_escape_dict = {
+    '\n': '',
+    '\\': '\\',
+    "'": "'",
+    '"': '"',
+    'a': '\a',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'v': '\v',
+}
+
+# bare (unquoted) values
+javascript_bare_value_dict = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'True': True,
+    'False': False,
+    'None': None,
+}
+
+def unescape_javascript_string(
+    escape_match: re.Match
+) -> str:
+    """
+    Arguments:
+    - escape_match: Match of javascript_string_escape_pattern
+
+    Returns the character for an escape sequence (unknown escapes are kept as is, like Python literals).
+    """
+
+    escape = escape_match.group(1)
+
+    if escape in javascript_string_escape_dict:
+        return javascript_string_escape_dict[escape]
+    elif escape[0] in 'xuU':
+        return chr(int(escape[1:], 16))
+    elif escape[0] in '01234567':
+        return chr(int(escape, 8))
+    else:
+        return escape_match.group(0)
+
+def convert_javascript_array_token(
+    token_match: re.Match
+) -> Any:
+    """
+    Arguments:
+    - token_match: Match of a quoted/bare javascript_array_token_pattern token
+
+    Returns the Python value of the token.
+    """
+
+    token_type = token_match.lastgroup
+    token = token_match.group(token_type)
+
+    if token_type in ('single_quoted', 'double_quoted'):
+        if '\\' in token:
+            token = javascript_string_escape_pattern.sub(unescape_javascript_string, token)
+        return token
+
+    if token in javascript_bare_value_dict:
+        return javascript_bare_value_dict[token]
+
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def iter_javascript_array(
+    value: str
+) -> Iterator[Any]:
+    """
+    Arguments:
+    - value: Javascript array literal (ex. matchmx value from scrape_javascript_vars)
+
+    Yields the array's top-level elements (ex. matchmx rows) one at a time.
+    Values match ast.literal_eval for quoted strings, numbers and nested arrays. Raises ValueError on invalid input.
+    """
+
+    # fast path: arrays that are valid JSON are parsed by the (C) json parser
+    try:
+        array = deserialize_json(data=value)
+    except ValueError:
+        array = None
+    if isinstance(array, list):
+        yield from array
+        return
+
+    # otherwise (ex. single quoted strings) tokenize the literal, building only one top-level element at a time
+
+    # lists under construction below the top-level array
+    list_stack = []
+    depth = 0
+    closed_flag = False
+    separator_expected_flag = False
+    position = 0
+
+    while True:
+
+        token_match = javascript_array_token_pattern.match(value, position)
+
+        if token_match is None:
+            if value[position:].strip() != '':
+                raise ValueError(f"Invalid javascript array literal at position {position}.")
+            break
+
+        if closed_flag:
+            raise ValueError(f"Unexpected value after javascript array literal at position {position}.")
+
+        position = token_match.end()
+        token_type = token_match.lastgroup
+
+        if token_type == 'open':
+
+            if separator_expected_flag:
+                raise ValueError(f"Missing ',' in javascript array literal at position {token_match.start(token_type)}.")
+
+            depth += 1
+            if depth > 1:
+                list_stack.append([])
+
+        elif token_type == 'close':
+
+            if depth == 0:
+                raise ValueError(f"Unexpected ']' in javascript array literal at position {token_match.start(token_type)}.")
+
+            depth -= 1
+            separator_expected_flag = True
+
+            if depth == 0:
+                closed_flag = True
+            elif depth == 1:
+                yield list_stack.pop()
+            else:
+                element = list_stack.pop()
+                list_stack[-1].append(element)
+
+        elif token_type == 'comma':
+
+            if not separator_expected_flag:
+                raise ValueError(f"Unexpected ',' in javascript array literal at position {token_match.start(token_type)}.")
+
+            separator_expected_flag = False
+
+        else:
+
+            if depth == 0 or separator_expected_flag:
+                raise ValueError(f"Unexpected value in javascript array literal at position {token_match.start(token_type)}.")
+
+            element = convert_javascript_array_token(token_match=token_match)
+            separator_expected_flag = True
+
+            if depth == 1:
+                yield element
+            else:
+                list_stack[-1].append(element)
+
+    if not closed_flag:
+        raise ValueError("Unterminated javascript array literal.")
\ No newline at end of file
@@ -0,0 +1,10 @@
+request_rate_limit_default_config = {
+    "requests_per_second": 4.0,                         # token refill rate per host
+    "min_requests_per_second": 0.25,                    # lowest refill rate per host after repeated throttling
+    "burst": 8,                                         # token bucket size per host
+    "retries": 3,                                       # number of request retries on transient errors
+    "backoff_base_seconds": 1,                          # base delay for exponential backoff
+    "backoff_max_seconds": 60,                          # max delay for exponential backoff (and honored Retry-After)
+    "retry_status_code_list": [429, 500, 502, 503, 504],
+    "throttle_status_code_list": [429, 503],            # status codes that slow down every worker for the host
+}
@@ -0,0 +1,6 @@
+request_session_default_config = {
+    "pool_connections": 10,             # number of per-host connection pools kept by the session
+    "pool_maxsize": 10,                 # number of keep-alive connections kept per host
+    "connect_timeout_seconds": 5,       # time allowed to establish the TCP/TLS connection
+    "read_timeout_seconds": 30,         # time allowed between bytes received from the server
+}
@@ -0,0 +1,5 @@
+import os
+
+response_cache_config = {
+    "cache_uri": os.environ.get("WEB_RESPONSE_CACHE_URI"),  # local directory or gs://<bucket>/<folder> (cache disabled if not set)
+}
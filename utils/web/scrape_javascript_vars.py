@@ -0,0 +1,70 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+import re
+
+# within page source, a declaration starts with: var {var}{optional spaces}={optional spaces}
+javascript_var_declaration_pattern = re.compile(r"var (?P<var>[\w$]+)(?=\s*=)")
+
+# assignment allowed before a single line value (same as scrape_javascript_var)
+javascript_var_assignment_pattern = re.compile(r"\s?=\s?")
+
+# assignment allowed before a multiline value (same as scrape_javascript_multiline_var)
+javascript_multiline_var_assignment_pattern = re.compile(r"\s*=\s*")
+
+def scrape_javascript_vars(
+    content: str,
+    var_list: List[str],
+    multiline_var_list: List[str] = []
+) -> Dict[str, Optional[str]]:
+    """
+    Arguments:
+    - content: web page content
+    - var_list: variables to scrape (value ends at the last ';' of the line)
+    - multiline_var_list: variables to scrape whose value may span lines (value ends at the first ';')
+
+    Scans the page once and returns dictionary of variable: value (or None), with the same values as
+    scrape_javascript_var / scrape_javascript_multiline_var.
+    """
+
+    var_set = set(var_list)
+    multiline_var_set = set(multiline_var_list)
+    var_dict = {var: None for var in [*var_list, *multiline_var_list]}
+    remaining_var_set = var_set | multiline_var_set
+
+    for var_match in javascript_var_declaration_pattern.finditer(content):
+
+        var = var_match.group('var')
+        if var not in remaining_var_set:
+            continue
+
+        if var in multiline_var_set:
+
+            # value runs (across lines) to the first ';'
+            assignment_match = javascript_multiline_var_assignment_pattern.match(content, var_match.end())
+            value_start = assignment_match.end()
+            value_end = content.find(';', value_start)
+
+        else:
+
+            # value runs to the last ';' of the line
+            assignment_match = javascript_var_assignment_pattern.match(content, var_match.end())
+            if assignment_match is None:
+                continue
+            value_start = assignment_match.end()
+            line_end = content.find('\n', value_start)
+            value_end = content.rfind(';', value_start, len(content) if line_end == -1 else line_end)
+
+        # no terminating ';' -> keep looking for a later declaration
+        if value_end == -1:
+            continue
+
+        var_dict[var] = content[value_start:value_end]
+        remaining_var_set.discard(var)
+
+        if not remaining_var_set:
+            break
+
+    return var_dict
\ No newline at end of file
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+from urllib.parse import urlparse
+from utils.web.scrape_url_list_default_config import scrape_url_list_default_config
+import asyncio
+import logging
+
+def scrape_url_list(
+    url_list: List[str],
+    scrape_function: Callable[[str], Dict],
+    concurrency_per_host: int = scrape_url_list_default_config['concurrency_per_host'],
+    politeness_delay_seconds: float = scrape_url_list_default_config['politeness_delay_seconds']
+) -> List[Dict]:
+    """
+    Arguments:
+    - url_list: List of urls to scrape
+    - scrape_function: Function that takes a url and returns a dictionary of scraped data (ex. get_match_data_scraped)
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+
+    Scrapes urls concurrently (bounded per host) and returns the scraped dictionaries in the same order as url_list.
+    Urls that raise an error return an empty dictionary.
+    """
+
+    if url_list == []:
+        return []
+
+    return asyncio.run(
+        scrape_url_list_async(
+            url_list=url_list,
+            scrape_function=scrape_function,
+            concurrency_per_host=concurrency_per_host,
+            politeness_delay_seconds=politeness_delay_seconds
+        )
+    )
+
+async def scrape_url_list_async(
+    url_list: List[str],
+    scrape_function: Callable[[str], Dict],
+    concurrency_per_host: int,
+    politeness_delay_seconds: float
+) -> List[Dict]:
+    """
+    Arguments:
+    - url_list: List of urls to scrape
+    - scrape_function: Function that takes a url and returns a dictionary of scraped data
+    - concurrency_per_host: Max number of in-flight requests per host
+    - politeness_delay_seconds: Time a request slot is held after each request before it is reused
+
+    Async implementation of scrape_url_list: scrape functions run in a thread pool, gated by a semaphore per host.
+    """
+
+    url_list_len = len(url_list)
+    concurrency_per_host = max(1, concurrency_per_host or 1)
+
+    # create one semaphore per host
+    host_list = list(dict.fromkeys(urlparse(url).netloc for url in url_list))
+    host_semaphore_dict = {
+        host: asyncio.Semaphore(concurrency_per_host)
+        for host in host_list
+    }
+
+    loop = asyncio.get_running_loop()
+
+    # size the pool so that every host can use all of its slots
+    with ThreadPoolExecutor(max_workers=concurrency_per_host * len(host_list)) as executor:
+
+        async def scrape_url(
+            i: int,
+            url: str
+        ) -> Dict:
+
+            async with host_semaphore_dict[urlparse(url).netloc]:
+
+                logging.info(f"({i+1}/{url_list_len}) Scraping url: {url}")
+
+                try:
+                    scrape_dict = await loop.run_in_executor(executor, scrape_function, url)
+                except Exception as e:
+                    logging.error(f"Error when scraping url {url}: {e}.")
+                    scrape_dict = {}
+
+                # hold the slot before releasing it to the next request
+                if politeness_delay_seconds:
+                    await asyncio.sleep(politeness_delay_seconds)
+
+                return scrape_dict or {}
+
+        # gather keeps results in url list order
+        scrape_dict_list = await asyncio.gather(*[
+            scrape_url(i=i, url=url)
+            for i, url in enumerate(url_list)
+        ])
+
+    return list(scrape_dict_list)
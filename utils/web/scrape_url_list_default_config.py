@@ -0,0 +1,4 @@
+scrape_url_list_default_config = {
+    "concurrency_per_host": 8,          # max number of in-flight requests per host
+    "politeness_delay_seconds": 0.5,    # time a request slot is held after each request before it is reused
+}